@@ -3,16 +3,24 @@ Custom integration to enhance all Todo lists in Home Assistant.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
-from functools import partial
-from typing import Any
+import time
+from bisect import bisect_left
+from calendar import monthrange
+from collections import OrderedDict
+from functools import lru_cache, partial
+from typing import Any, Awaitable, Callable
+import weakref
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_STATE_CHANGED, Platform
 from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import ServiceNotFound
 from homeassistant.helpers import event as event_helper
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.components.todo import DOMAIN as TODO_DOMAIN, TodoListEntity, TodoListEntityFeature, TodoItem
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import re
 
 from .const import (
@@ -27,15 +35,216 @@ from .const import (
 LOGGER = logging.getLogger(__name__)
 PLATFORMS: list[Platform] = [Platform.TODO]
 
-# Simple lock to prevent concurrent processing of the same entity
-PROCESSING_LOCKS = set()
+
+class BoundedSet:
+    """Set of keys that expire after ttl_seconds and hold at most maxlen entries."""
+
+    def __init__(self, maxlen: int, ttl_seconds: float) -> None:
+        """Initialize an empty set."""
+        self.maxlen = maxlen
+        self.ttl_seconds = ttl_seconds
+        # Key -> time added, oldest first
+        self._entries: OrderedDict[str, float] = OrderedDict()
+
+    def add(self, key: str) -> None:
+        """Add a key, evicting the oldest entry when full."""
+        self._entries.pop(key, None)
+        self._entries[key] = time.monotonic()
+        if len(self._entries) > self.maxlen:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        """Remove a key if present."""
+        self._entries.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the key was added less than ttl_seconds ago."""
+        added = self._entries.get(key)
+        if added is None:
+            return False
+        if time.monotonic() - added >= self.ttl_seconds:
+            del self._entries[key]
+            return False
+        return True
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+
+class GetItemsFetchCancelled(Exception):
+    """Raised to callers sharing a get_items fetch whose starting task was cancelled."""
+
+
+# Items whose summaries were scanned for new-item processing without finding a date or repeat pattern
+# Keyed by entity_id, uid and summary, so only unseen or edited items get scanned again
+ITEMS_WITHOUT_DATE_PATTERN = BoundedSet(maxlen=10_000, ttl_seconds=86400)
+
+# Per-entity locks to prevent concurrent processing of the same entity
+PROCESSING_LOCKS: dict[str, asyncio.Lock] = {}
 
 # Track completed tasks that have already been processed to prevent duplicates
-PROCESSED_COMPLETED_ITEMS = set()
+# Bounded so long-running installs don't accumulate keys forever
+PROCESSED_COMPLETED_ITEMS = BoundedSet(maxlen=10_000, ttl_seconds=86400)
 
 # Track newly created recurring tasks to prevent reprocessing
-NEWLY_CREATED_RECURRING_TASKS = set()
+# Entries expire after 5 seconds; the task should have its due date set by then
+NEWLY_CREATED_RECURRING_TASKS = BoundedSet(maxlen=1_000, ttl_seconds=5)
+
+# Short-lived get_items results per entity so handlers fired by one state change share a fetch
+# Maps entity_id -> (loop time the fetch started, future resolving to the service response)
+GET_ITEMS_CACHE: dict[str, tuple[float, asyncio.Future]] = {}
+GET_ITEMS_CACHE_TTL = 0.5
+
+# Maximum number of todo entities the daily auto-clear works on at once
+AUTO_CLEAR_MAX_CONCURRENT_ENTITIES = 8
+
+# Per-entity settings built from config entry options, keyed by (entry_id, entity_id)
+# Cleared for an entry when its options change
+ENTITY_SETTINGS_CACHE: dict[tuple[str, str], dict[str, Any]] = {}
+
+# Todo entity objects found by find_todo_entity, keyed by entity_id
+# Weak references so a removed entity isn't kept alive; dropped when the registry entry changes
+TODO_ENTITY_CACHE: dict[str, weakref.ref] = {}
+
+# Hash of the (uid, due) sequence of each list auto-sort last found already sorted
+SORTED_ORDER_HASHES: dict[str, int] = {}
+
+# Option keys of the daily/weekly/monthly smart lists (the fallback list isn't a smart list)
+SMART_LIST_KEYS = (CONF_DAILY_LIST, CONF_WEEKLY_LIST, CONF_MONTHLY_LIST)
+
+# Smart list settings per config entry, cleared along with ENTITY_SETTINGS_CACHE
+SMART_LIST_SETTINGS_CACHE: dict[str, dict[str, Any]] = {}
+
+# One work queue and consumer task per entity so state change handlers run serially
+# Queued work maps a kind to a coroutine factory; kinds run in ENTITY_WORK_ORDER
+ENTITY_QUEUES: dict[str, asyncio.Queue] = {}
+ENTITY_WORKERS: dict[str, asyncio.Task] = {}
+ENTITY_WORK_ORDER = ("new_item", "recurring", "smart_completion", "auto_sort", "auto_clear")
+
+# Date text that can follow an 'in', ':' or ': in' prefix
+PREFIXED_NATURAL_DATES = (r'today|tomorrow|\d+\s*(?:days?|weeks?|months?|years?|[dwmy])',)
+PREFIXED_NUMERIC_DATES = (
+    r'\d{1,2}/\d{1,2}/\d{2,4}',  # MM/DD/YY, MM/DD/YYYY
+    r'\d{1,2}-\d{1,2}-\d{2,4}',  # MM-DD-YY, MM-DD-YYYY
+    r'\d{4}-\d{1,2}-\d{1,2}',    # YYYY-MM-DD
+    r'\d{4}/\d{1,2}/\d{1,2}',    # YYYY/MM/DD
+    r'\d{1,2}\.\d{1,2}\.\d{2,4}',  # DD.MM.YYYY
+)
+
+# Prefixed dates in the order remove_date_prefixes tries them: natural language dates before
+# numeric ones, ': in' before a bare 'in' or ':', then numeric formats in the order above.
+# 'in' must start a word so words like 'main' or 'plain' aren't cut short
+PREFIX_DATE_PATTERNS = tuple(
+    re.compile(rf'\s*({prefix})\s+({date})', re.IGNORECASE)
+    for dates in (PREFIXED_NATURAL_DATES, PREFIXED_NUMERIC_DATES)
+    for prefix in (r':\s*in', r'\bin|:')
+    for date in dates
+)
+
+# Date-like words checked when scanning todo item summaries: slash/dash dates or ISO dates
+DATE_WORD_PATTERN = re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4}-\d{1,2}-\d{1,2}')
+DURATION_PATTERN = re.compile(r'^\d+\s*(days?|weeks?|months?|years?|[dwmy])$', re.IGNORECASE)
 
+# Words parse_natural_language_date accepts without any digits
+NATURAL_DATE_WORDS = frozenset(("today", "tomorrow"))
+
+# Repeat pattern bodies (text inside the brackets, lowercased): [2d], [2w-mwf], [mwf]
+INTERVAL_PATTERN = re.compile(r'^(\d+)([dwmy])$')
+WEEKLY_DAYS_PATTERN = re.compile(r'^(?:(\d+)w|w)-([mtwrfsu]+)$')
+DAYS_ONLY_PATTERN = re.compile(r'^[mtwrfsu]+$')
+
+# Relative dates like '5d', '5 days', '2w' searched for in lowercased text
+RELATIVE_DATE_PATTERN = re.compile(r'(\d+)\s*(days?|weeks?|months?|years?|[dwmy])')
+
+# Prefix words dropped from summaries along with the dates and times they introduce
+DATE_PREFIX_WORDS = frozenset(("at", "@", "in", ":"))
+
+# Single-letter repeat units for simple patterns like [d] and [w]
+REPEAT_UNITS = frozenset(("d", "w", "m", "y"))
+
+# Every character a repeat pattern can contain: interval digits, units, '-' and day letters
+REPEAT_PATTERN_CHARS = frozenset("0123456789dwmy-mtwrfsu")
+
+# Map repeat pattern day characters to day abbreviations
+# m=mon, t=tue, w=wed, r=thu, f=fri, s=sat, u=sun
+DAY_MAPPING = {
+    'm': 'mon', 't': 'tue', 'w': 'wed', 'r': 'thu',
+    'f': 'fri', 's': 'sat', 'u': 'sun'
+}
+
+# Reverse of DAY_MAPPING, used to rebuild repeat pattern strings
+DAY_CHARS = {day: char for char, day in DAY_MAPPING.items()}
+
+# Map day names to weekday numbers (Monday=0, Sunday=6)
+DAY_TO_NUM = {
+    'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3,
+    'fri': 4, 'sat': 5, 'sun': 6
+}
+
+# Supported numeric date and time formats, tried in order
+DATE_FORMATS = ['%m/%d/%y', '%m/%d/%Y', '%m-%d-%y', '%m-%d-%Y', '%Y-%m-%d', '%Y/%m/%d', '%Y.%m.%d', '%d-%m-%Y', '%d/%m/%Y', '%d.%m.%Y', '%m.%d.%Y', '%Y-%d-%m', '%Y/%d/%m', '%Y.%d.%m', '%d-%Y-%m', '%d/%Y/%m', '%d.%Y.%m', '%m-%Y-%d', '%m/%Y/%d', '%m.%Y.%d']
+TIME_FORMATS = ['%H:%M', '%H %M', '%H%M']
+
+# Field regexes copied from CPython's _strptime so matching behaves exactly like datetime.strptime
+STRPTIME_FIELD_PATTERNS = {
+    'd': r'(3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+    'm': r'(1[0-2]|0[1-9]|[1-9])',
+    'y': r'(\d\d)',
+    'Y': r'(\d\d\d\d)',
+    'H': r'(2[0-3]|[0-1]\d|\d)',
+    'M': r'([0-5]\d|\d)',
+}
+
+
+def compile_strptime_format(given_format: str) -> tuple[re.Pattern, str]:
+    """Compile a numeric strptime format into a regex and its field order.
+    
+    Like strptime, literal whitespace in the format matches any run of whitespace.
+    
+    Returns:
+        (compiled pattern, directive letters in the order they are captured)
+    """
+    parts = []
+    fields = ""
+    for piece in re.split(r'(%[a-zA-Z])', given_format):
+        if piece.startswith('%'):
+            parts.append(STRPTIME_FIELD_PATTERNS[piece[1]])
+            fields += piece[1]
+        elif piece:
+            parts.append(r'\s+'.join(re.escape(literal) for literal in re.split(r'\s+', piece)))
+    return re.compile(''.join(parts)), fields
+
+
+# Compiled once; only strings shaped like three numeric fields with a repeated separator can match a date format
+COMPILED_DATE_FORMATS = [compile_strptime_format(date_format) for date_format in DATE_FORMATS]
+COMPILED_TIME_FORMATS = [compile_strptime_format(time_format) for time_format in TIME_FORMATS]
+DATE_SHAPE_PATTERN = re.compile(r' ?\d+([-/.]) ?\d+\1 ?\d+')
+
+
+def match_compiled_formats(given_string: str, compiled_formats: list[tuple[re.Pattern, str]]) -> datetime | None:
+    """Return the datetime for the first format that parses given_string, like strptime would."""
+    for pattern, fields in compiled_formats:
+        match = pattern.match(given_string)
+        # strptime rejects input with unconverted data left over
+        if not match or match.end() != len(given_string):
+            continue
+        values = dict(zip(fields, match.groups()))
+        if 'Y' in values:
+            year = int(values['Y'])
+        elif 'y' in values:
+            year = int(values['y'])
+            # strptime's two-digit year pivot: 69-99 -> 1900s, 00-68 -> 2000s
+            year += 2000 if year <= 68 else 1900
+        else:
+            year = 1900
+        try:
+            return datetime(year, int(values.get('m', 1)), int(values.get('d', 1)),
+                            int(values.get('H', 0)), int(values.get('M', 0)))
+        except ValueError:
+            # Out of range for the month (e.g. Feb 30); strptime fails too, try the next format
+            continue
+    return None
 
 
 def check_date_format(given_string: str) -> datetime | None:
@@ -45,38 +254,43 @@ def check_date_format(given_string: str) -> datetime | None:
     if natural_date:
         return natural_date
     
-    # Then try traditional date formats
-    date_formats = ['%m/%d/%y', '%m/%d/%Y', '%m-%d-%y', '%m-%d-%Y', '%Y-%m-%d', '%Y/%m/%d', '%Y.%m.%d', '%d-%m-%Y', '%d/%m/%Y', '%d.%m.%Y', '%m-%d-%Y', '%m/%d/%Y', '%m.%d.%Y', '%Y-%d-%m', '%Y/%d/%m', '%Y.%d.%m', '%d-%Y-%m', '%d/%Y/%m', '%d.%Y.%m', '%m-%Y-%d', '%m/%Y/%d', '%m.%Y.%d']
-    return check_formats(given_string, date_formats)
+    return parse_numeric_date(given_string)
 
 
-def check_time_format(given_string: str) -> datetime | None:
-    """Check if given string matches any supported time format."""
-    time_formats = ['%H:%M', '%H %M', '%H%M']
-    return check_formats(given_string, time_formats)
+@lru_cache(maxsize=1024)
+def parse_numeric_date(given_string: str) -> datetime | None:
+    """Parse given string with the supported numeric date formats."""
+    # None of the formats below use textual directives (%b, %a, ...), so any letter means no match
+    if any(char.isalpha() for char in given_string):
+        return None
+    
+    # Then try traditional date formats; one shape check rules out most strings
+    if not DATE_SHAPE_PATTERN.fullmatch(given_string):
+        return None
+    return match_compiled_formats(given_string, COMPILED_DATE_FORMATS)
 
 
-def check_formats(given_string: str, formats: list[str]) -> datetime | None:
-    """Check if given string matches any of the provided formats."""
-    for given_format in formats:
-        try:
-            return_time = datetime.strptime(given_string, given_format)
-            return return_time
-        except ValueError:
-            continue
-    return None
+@lru_cache(maxsize=1024)
+def check_time_format(given_string: str) -> datetime | None:
+    """Check if given string matches any supported time format."""
+    return match_compiled_formats(given_string, COMPILED_TIME_FORMATS)
 
 
+@lru_cache(maxsize=1024)
 def parse_repeat_pattern(pattern_string: str) -> dict[str, Any] | None:
     """Parse repeat patterns like [d], [w], [m], [y], [w-mwf], etc.
     
+    Results are cached per pattern string and shared between callers, so
+    the returned dict must not be modified.
+    
     Returns:
         dict with pattern info or None if invalid pattern
         Format: {
             'type': 'simple' | 'advanced',
             'unit': 'd' | 'w' | 'm' | 'y',
             'interval': int (default 1),
-            'days': list of day abbreviations for weekly patterns (optional)
+            'days': tuple of day abbreviations for weekly patterns (optional),
+            'weekday_mask': int with bit N set for each weekday N (Monday=0) in 'days' (optional)
         }
     """
     if not pattern_string.startswith("[") or not pattern_string.endswith("]"):
@@ -89,15 +303,19 @@ def parse_repeat_pattern(pattern_string: str) -> dict[str, Any] | None:
         return None
     
     # Simple patterns: [d], [w], [m], [y]
-    if pattern in ('d', 'w', 'm', 'y'):
+    if pattern in REPEAT_UNITS:
         return {
             'type': 'simple',
             'unit': pattern,
             'interval': 1
         }
     
+    # Anything with characters outside the pattern alphabet can't match the regexes below
+    if not REPEAT_PATTERN_CHARS.issuperset(pattern):
+        return None
+    
     # Interval patterns: [2d], [3w], [2m], [1y]
-    interval_match = re.match(r'^(\d+)([dwmy])$', pattern)
+    interval_match = INTERVAL_PATTERN.match(pattern)
     if interval_match:
         interval = int(interval_match.group(1))
         unit = interval_match.group(2)
@@ -108,54 +326,54 @@ def parse_repeat_pattern(pattern_string: str) -> dict[str, Any] | None:
         }
     
     # Advanced weekly patterns: [w-mwf], [2w-mtf], etc.
-    weekly_match = re.match(r'^(?:(\d+)w|w)-([mtwrfsu]+)$', pattern)
+    weekly_match = WEEKLY_DAYS_PATTERN.match(pattern)
     if weekly_match:
         interval = int(weekly_match.group(1)) if weekly_match.group(1) else 1
         day_string = weekly_match.group(2)
         
         # Convert day string to list of day abbreviations
-        # m=mon, t=tue, w=wed, r=thu, f=fri, s=sat, u=sun
-        day_mapping = {
-            'm': 'mon', 't': 'tue', 'w': 'wed', 'r': 'thu', 
-            'f': 'fri', 's': 'sat', 'u': 'sun'
-        }
-        
-        days = []
-        for char in day_string:
-            if char in day_mapping:
-                days.append(day_mapping[char])
+        days = tuple(DAY_MAPPING[char] for char in day_string)
         
         if days:
             return {
                 'type': 'advanced',
                 'unit': 'w',
                 'interval': interval,
-                'days': days
+                'days': days,
+                'weekday_mask': sum({1 << DAY_TO_NUM[day] for day in days})
             }
     
     # Special case: direct day patterns like [mwf] without w-
-    if re.match(r'^[mtwrfsu]+$', pattern):
-        day_mapping = {
-            'm': 'mon', 't': 'tue', 'w': 'wed', 'r': 'thu', 
-            'f': 'fri', 's': 'sat', 'u': 'sun'
-        }
-        
-        days = []
-        for char in pattern:
-            if char in day_mapping:
-                days.append(day_mapping[char])
+    if DAYS_ONLY_PATTERN.match(pattern):
+        days = tuple(DAY_MAPPING[char] for char in pattern)
         
         if days:
             return {
                 'type': 'advanced',
                 'unit': 'w',
                 'interval': 1,
-                'days': days
+                'days': days,
+                'weekday_mask': sum({1 << DAY_TO_NUM[day] for day in days})
             }
     
     return None
 
 
+def days_until_next_weekday(weekday_mask: int, weekday: int) -> int:
+    """Return how many days (1-7) after the given weekday the next day in the mask falls.
+    
+    Args:
+        weekday_mask: Pattern days as a bitmask, bit N set for weekday N (Monday=0)
+        weekday: Weekday to count from (Monday=0)
+    
+    Returns:
+        Days until the next pattern day, 7 if the weekday itself is the only one
+    """
+    # Rotate the week so the day after 'weekday' sits at bit 0, then find the lowest set bit
+    rotated = ((weekday_mask >> (weekday + 1)) | (weekday_mask << (6 - weekday))) & 0x7F
+    return (rotated & -rotated).bit_length()
+
+
 def calculate_first_occurrence(today: datetime, repeat_info: dict[str, Any]) -> datetime | None:
     """Calculate the first occurrence date for a new recurring task.
     
@@ -193,42 +411,18 @@ def calculate_first_occurrence(today: datetime, repeat_info: dict[str, Any]) ->
     
     elif repeat_info['type'] == 'advanced' and unit == 'w':
         # Advanced weekly patterns with specific days
-        days = repeat_info.get('days', [])
-        if not days:
-            return None
-        
-        # Map day names to weekday numbers (Monday=0, Sunday=6)
-        day_to_num = {
-            'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3,
-            'fri': 4, 'sat': 5, 'sun': 6
-        }
-        
-        target_weekdays = [day_to_num[day] for day in days if day in day_to_num]
-        if not target_weekdays:
+        weekday_mask = repeat_info.get('weekday_mask')
+        if not weekday_mask:
             return None
         
-        target_weekdays.sort()
         current_weekday = today.weekday()
         
         # Check if today is one of the target days
-        if current_weekday in target_weekdays:
+        if weekday_mask >> current_weekday & 1:
             return today
         
-        # Find next occurrence day in the current week
-        next_weekday = None
-        for weekday in target_weekdays:
-            if weekday > current_weekday:
-                next_weekday = weekday
-                break
-        
-        if next_weekday is not None:
-            # Next occurrence is later this week
-            days_ahead = next_weekday - current_weekday
-            return today + timedelta(days=days_ahead)
-        else:
-            # Next occurrence is next week (first day of pattern)
-            days_to_next_week = 7 - current_weekday + target_weekdays[0]
-            return today + timedelta(days=days_to_next_week)
+        # Otherwise the next matching day, later this week or early next week
+        return today + timedelta(days=days_until_next_weekday(weekday_mask, current_weekday))
     
     return None
 
@@ -265,26 +459,18 @@ def schedule_next_occurrence(completion_date: datetime, original_due_date: datet
             # Monthly patterns: calculate based on completion timing
             if completion_date_only <= original_due_date_only:
                 # Early or on-time: next month from original due date
-                target_month = original_due_date_only.month + interval
-                target_year = original_due_date_only.year
-                while target_month > 12:
-                    target_month -= 12
-                    target_year += 1
+                years_ahead, month_index = divmod(original_due_date_only.month - 1 + interval, 12)
+                target_month = month_index + 1
+                target_year = original_due_date_only.year + years_ahead
             else:
                 # Late: next month from completion date
-                target_month = completion_date_only.month + interval
-                target_year = completion_date_only.year
-                while target_month > 12:
-                    target_month -= 12
-                    target_year += 1
+                years_ahead, month_index = divmod(completion_date_only.month - 1 + interval, 12)
+                target_month = month_index + 1
+                target_year = completion_date_only.year + years_ahead
             
             # Set to end of target month at 23:59
-            if target_month == 12:
-                next_month_start = datetime(target_year + 1, 1, 1)
-            else:
-                next_month_start = datetime(target_year, target_month + 1, 1)
-            end_of_month = next_month_start - timedelta(days=1)
-            return end_of_month.replace(hour=23, minute=59, second=0, microsecond=0)
+            last_day = monthrange(target_year, target_month)[1]
+            return datetime(target_year, target_month, last_day, 23, 59)
         elif unit == 'y':
             # Yearly patterns: calculate from original due date if early/on-time, completion if late
             if completion_date_only <= original_due_date_only:
@@ -296,169 +482,155 @@ def schedule_next_occurrence(completion_date: datetime, original_due_date: datet
     
     elif repeat_info['type'] == 'advanced' and unit == 'w':
         # Advanced weekly patterns with specific days
-        days = repeat_info.get('days', [])
-        if not days:
+        weekday_mask = repeat_info.get('weekday_mask')
+        if not weekday_mask:
             return None
         
-        # Map day names to weekday numbers (Monday=0, Sunday=6)
-        day_to_num = {
-            'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3,
-            'fri': 4, 'sat': 5, 'sun': 6
-        }
-        
-        target_weekdays = [day_to_num[day] for day in days if day in day_to_num]
-        if not target_weekdays:
-            return None
-        
-        target_weekdays.sort()
         completion_weekday = completion_date_only.weekday()
         original_due_weekday = original_due_date_only.weekday()
         
+        # Next day in the pattern sequence after the original due day; past Sunday it wraps to the next cycle
+        days_after_due = days_until_next_weekday(weekday_mask, original_due_weekday)
+        next_weekday = (original_due_weekday + days_after_due) % 7
+        next_cycle = original_due_weekday + days_after_due > 6
+        days_ahead = next_weekday - completion_weekday
+        
         if completion_date_only <= original_due_date_only:
-            # Early or on-time completion
-            # Find next day in the pattern sequence after the original due day
-            next_weekday = None
-            
-            for weekday in target_weekdays:
-                if weekday > original_due_weekday:
-                    next_weekday = weekday
-                    break
-            
-            if next_weekday is not None:
-                # Next occurrence is later this week
-                days_ahead = next_weekday - completion_weekday
-                if days_ahead <= 0:
-                    # If that day has already passed this week, go to next cycle
-                    days_ahead += 7 + (interval - 1) * 7
-                return completion_date_only + timedelta(days=days_ahead)
-            else:
-                # Next occurrence is first day of next cycle
-                days_to_next_cycle = 7 - completion_weekday + target_weekdays[0] + (interval - 1) * 7
-                return completion_date_only + timedelta(days=days_to_next_cycle)
-        else:
-            # Late completion
-            # Find next day in the pattern sequence after the original due day
-            next_weekday = None
-            for weekday in target_weekdays:
-                if weekday > original_due_weekday:
-                    next_weekday = weekday
-                    break
-            
-            if next_weekday is not None:
-                # Next occurrence is later in the same week as original due date
-                # But calculate from completion date to that day
-                days_to_next = next_weekday - completion_weekday
-                if days_to_next <= 0:
-                    # If that day has already passed this week, go to next cycle
-                    days_to_next += 7 + (interval - 1) * 7
-                return completion_date_only + timedelta(days=days_to_next)
-            else:
-                # Next occurrence is first day of next cycle
-                days_to_next_cycle = 7 - completion_weekday + target_weekdays[0] + (interval - 1) * 7
-                return completion_date_only + timedelta(days=days_to_next_cycle)
+            # Early or on-time completion: a day in the next cycle, or one that has already
+            # passed this week, moves to the next cycle
+            if next_cycle or days_ahead <= 0:
+                days_ahead += 7 * interval
+        elif next_cycle or days_ahead <= 0:
+            # Late completion: the next time that weekday comes around after completion
+            days_ahead = (days_ahead % 7 or 7) + (interval - 1) * 7
+        
+        return completion_date_only + timedelta(days=days_ahead)
     
     return None
 
 
+def start_of_today() -> datetime:
+    """Return today at midnight as a naive datetime."""
+    # date.today() skips the time-of-day fields that datetime.now() would build only to zero out
+    return datetime.fromordinal(date.today().toordinal())
+
+
 def parse_natural_language_date(given_string: str) -> datetime | None:
     """Parse natural language date patterns like 'today', 'tomorrow', '5d', '2w', etc."""
-    now = datetime.now()
-    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    offset = parse_relative_date_offset(given_string)
+    if offset is None:
+        return None
+    
+    today = start_of_today()
+    return today + offset
+
+
+@lru_cache(maxsize=1024)
+def parse_relative_date_offset(given_string: str) -> timedelta | None:
+    """Return how far from today a natural language date lies, or None if it isn't one.
+    
+    Kept separate from parse_natural_language_date so the result doesn't depend
+    on the current date and can be cached.
+    """
+    given_lower = given_string.lower()
     
     # Handle 'today' and 'tomorrow'
-    if given_string.lower() == 'today':
-        return today
-    elif given_string.lower() == 'tomorrow':
-        return today + timedelta(days=1)
+    if given_lower == 'today':
+        return timedelta()
+    elif given_lower == 'tomorrow':
+        return timedelta(days=1)
     
     # Handle duration patterns with flexible spacing and word forms
     # Patterns: '5d', '5 d', '5day', '5 day', '5 days', '5days', etc.
     # Order matters: match longer forms first to avoid greedy matching of single letters
-    duration_pattern = re.search(r'(\d+)\s*(days?|weeks?|months?|years?|[dwmy])', given_string.lower())
+    duration_pattern = RELATIVE_DATE_PATTERN.search(given_lower)
     if duration_pattern:
         amount = int(duration_pattern.group(1))
         unit = duration_pattern.group(2)
         
         if unit in ('d', 'day', 'days'):
-            return today + timedelta(days=amount)
+            return timedelta(days=amount)
         elif unit in ('w', 'week', 'weeks'):
-            return today + timedelta(weeks=amount)
+            return timedelta(weeks=amount)
         elif unit in ('m', 'month', 'months'):
             # Approximate month as 30 days
-            return today + timedelta(days=amount * 30)
+            return timedelta(days=amount * 30)
         elif unit in ('y', 'year', 'years'):
             # Approximate year as 365 days
-            return today + timedelta(days=amount * 365)
+            return timedelta(days=amount * 365)
     
     return None
 
 
+def looks_like_date_word(word: str) -> bool:
+    """Cheap prefilter: True if word could be a natural language or numeric date.
+    
+    Every numeric and duration format needs a digit, so only 'today' and
+    'tomorrow' can match without one.
+    """
+    return any(char.isdigit() for char in word) or word.lower() in NATURAL_DATE_WORDS
+
+
 def remove_date_prefixes(summary: str) -> str:
     """Remove 'in' or ':' prefixes before date patterns and return cleaned summary."""
     # Pattern to match ' in <date>' or ': <date>' or ' in <date> @' or ': <date> @' patterns
     # This handles cases like "wash clothes in 5d" or "brush the dog: 1d [1w]"
-    
-    # First, handle the special ': in' case
-    colon_in_pattern = re.search(r'\s*:\s*in\s+(today|tomorrow|\d+\s*(?:days?|weeks?|months?|years?|[dwmy]))', summary.lower())
-    if colon_in_pattern:
-        # Remove the ': in' prefix and keep the rest
-        prefix_start = colon_in_pattern.start()
-        result = summary[:prefix_start] + ' ' + summary[colon_in_pattern.start(1):]
-        # Clean up any double spaces
-        return re.sub(r'\s+', ' ', result).strip()
-    
-    # Then handle regular 'in' or ':' patterns
-    natural_lang_with_prefix = re.search(r'\s*(in|:)\s+(today|tomorrow|\d+\s*(?:days?|weeks?|months?|years?|[dwmy]))', summary.lower())
-    if natural_lang_with_prefix:
-        # Remove the prefix and keep the rest
-        prefix_start = natural_lang_with_prefix.start(1)  # Start of 'in' or ':'
-        result = summary[:prefix_start] + ' ' + summary[natural_lang_with_prefix.start(2):]
-        # Clean up any double spaces
-        return re.sub(r'\s+', ' ', result).strip()
-    
-    # Also handle regular date formats with prefixes
-    # Pattern for various date formats after 'in' or ':'
-    date_patterns = [
-        r'\d{1,2}/\d{1,2}/\d{2,4}',  # MM/DD/YY, MM/DD/YYYY
-        r'\d{1,2}-\d{1,2}-\d{2,4}',  # MM-DD-YY, MM-DD-YYYY
-        r'\d{4}-\d{1,2}-\d{1,2}',    # YYYY-MM-DD
-        r'\d{4}/\d{1,2}/\d{1,2}',    # YYYY/MM/DD
-        r'\d{1,2}\.\d{1,2}\.\d{2,4}', # DD.MM.YYYY
-    ]
-    
-    # Handle ': in' with regular dates
-    for pattern in date_patterns:
-        colon_in_date_pattern = rf'\s*:\s*in\s+({pattern})'
-        match = re.search(colon_in_date_pattern, summary, re.IGNORECASE)
+    for pattern in PREFIX_DATE_PATTERNS:
+        match = pattern.search(summary)
         if match:
-            prefix_start = match.start()
-            result = summary[:prefix_start] + ' ' + summary[match.start(1):]
-            return re.sub(r'\s+', ' ', result).strip()
-    
-    # Handle regular 'in' or ':' with dates
-    for pattern in date_patterns:
-        regex_pattern = rf'\s*(in|:)\s+({pattern})'
-        match = re.search(regex_pattern, summary, re.IGNORECASE)
-        if match:
-            prefix_start = match.start(1)
-            result = summary[:prefix_start] + ' ' + summary[match.start(2):]
-            # Clean up any double spaces
-            return re.sub(r'\s+', ' ', result).strip()
+            break
+    else:
+        return summary
     
-    return summary
+    # Drop the prefix, keep the date and everything after it, then collapse whitespace
+    result = summary[:match.start(1)] + ' ' + summary[match.start(2):]
+    return ' '.join(result.split())
+
+
+# Canonical 'YYYY-MM-DD' due dates, which fromisoformat parses exactly like strptime's '%Y-%m-%d'
+ISO_DAY_PATTERN = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
 
 
-def analyze_task_timeframe(due_date: datetime) -> str:
+@lru_cache(maxsize=1024)
+def parse_due_date(due_string: str) -> datetime:
+    """Parse a todo item's due value ('YYYY-MM-DD' or an ISO datetime) as a naive datetime.
+    
+    Raises:
+        ValueError: if the value isn't a valid date or datetime
+    """
+    if "T" in due_string:
+        # Due datetime format; fromisoformat accepts a trailing 'Z' on Python 3.11+
+        # Convert to naive datetime for comparison
+        return datetime.fromisoformat(due_string).replace(tzinfo=None)
+    
+    # Due date only format; fromisoformat is implemented in C, strptime covers anything non-canonical
+    if ISO_DAY_PATTERN.fullmatch(due_string):
+        return datetime.fromisoformat(due_string)
+    return datetime.strptime(due_string, "%Y-%m-%d")
+
+
+@lru_cache(maxsize=4)
+def get_week_bounds(today_ordinal: int) -> tuple[datetime, datetime]:
+    """Return the (Sunday, Saturday) midnights of the week containing the given day ordinal."""
+    today = datetime.fromordinal(today_ordinal)
+    # Find the start of this week (Sunday)
+    days_since_sunday = (today.weekday() + 1) % 7  # Monday=0, so Sunday=6 -> 0
+    week_start = today - timedelta(days=days_since_sunday)
+    return week_start, week_start + timedelta(days=6)
+
+
+def analyze_task_timeframe(due_date: datetime, today: datetime | None = None) -> str:
     """Categorize tasks by timeframe.
     
     Args:
         due_date: The due date of the task
+        today: Today at midnight; pass it in when categorizing many tasks at once
     
     Returns:
         'today', 'this_week', 'this_month', or 'other'
     """
-    now = datetime.now()
-    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if today is None:
+        today = start_of_today()
     
     # Strip time from due_date for comparison
     due_date_only = due_date.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -468,10 +640,7 @@ def analyze_task_timeframe(due_date: datetime) -> str:
         return 'today'
     
     # Check if due this week (Sunday to Saturday)
-    # Find the start of this week (Sunday)
-    days_since_sunday = (today.weekday() + 1) % 7  # Monday=0, so Sunday=6 -> 0
-    week_start = today - timedelta(days=days_since_sunday)
-    week_end = week_start + timedelta(days=6)
+    week_start, week_end = get_week_bounds(today.toordinal())
     
     if week_start <= due_date_only <= week_end:
         return 'this_week'
@@ -506,22 +675,29 @@ def get_smart_list_for_timeframe(timeframe: str, smart_list_config: dict[str, An
     return None
 
 
-def get_smart_list_settings(options: dict[str, Any]) -> dict[str, Any]:
+def get_smart_list_settings(options: dict[str, Any], entry_id: str | None = None) -> dict[str, Any]:
     """Extract smart list settings from options.
     
+    When entry_id is given the result is cached until the entry's options change.
+    The returned dict is shared between callers and must not be modified.
+    
     Args:
         options: Configuration options dictionary
+        entry_id: Config entry ID to cache the result under
     
     Returns:
         Smart list configuration dictionary
     """
-    return {
-        CONF_ENABLE_SMART_LISTS: options.get(CONF_ENABLE_SMART_LISTS, False),
-        CONF_DAILY_LIST: options.get(CONF_DAILY_LIST, ""),
-        CONF_WEEKLY_LIST: options.get(CONF_WEEKLY_LIST, ""),
-        CONF_MONTHLY_LIST: options.get(CONF_MONTHLY_LIST, ""),
-        CONF_FALLBACK_LIST: options.get(CONF_FALLBACK_LIST, ""),
-    }
+    if entry_id is not None:
+        cached = SMART_LIST_SETTINGS_CACHE.get(entry_id)
+        if cached is not None:
+            return cached
+    
+    smart_config = {key: options.get(key, "") for key in SMART_LIST_KEYS + (CONF_FALLBACK_LIST,)}
+    smart_config[CONF_ENABLE_SMART_LISTS] = options.get(CONF_ENABLE_SMART_LISTS, False)
+    if entry_id is not None:
+        SMART_LIST_SETTINGS_CACHE[entry_id] = smart_config
+    return smart_config
 
 
 async def replicate_task_to_smart_lists(hass: HomeAssistant, item: dict[str, Any], 
@@ -543,11 +719,7 @@ async def replicate_task_to_smart_lists(hass: HomeAssistant, item: dict[str, Any
     
     try:
         # Parse due date
-        if "T" in due_date_str:
-            due_date = datetime.fromisoformat(due_date_str.replace("Z", "+00:00"))
-            due_date = due_date.replace(tzinfo=None)
-        else:
-            due_date = datetime.strptime(due_date_str, "%Y-%m-%d")
+        due_date = parse_due_date(due_date_str)
         
         # Determine which smart lists should contain this task (same logic as reflection)
         timeframe = analyze_task_timeframe(due_date)
@@ -572,19 +744,14 @@ async def replicate_task_to_smart_lists(hass: HomeAssistant, item: dict[str, Any
             return
         
         summary = item.get("summary", "")
-        replicated_count = 0
         
-        # Replicate to all applicable smart lists
-        for target_list in target_smart_lists:
-            if target_list == source_entity_id:
-                # Skip if task is already in this list
-                continue
-                
+        async def replicate_to_list(target_list: str) -> bool:
+            """Add the task to one smart list, returning whether it was added."""
             # Check if task already exists in target list to avoid duplicates
             existing_task = await find_task_in_list(hass, target_list, summary, due_date_str)
             if existing_task:
                 LOGGER.debug("Task already exists in target smart list %s: %s", target_list, summary)
-                continue
+                return False
             
             # Replicate task to this smart list
             add_item_dict = {
@@ -605,9 +772,18 @@ async def replicate_task_to_smart_lists(hass: HomeAssistant, item: dict[str, Any
                 add_item_dict,
                 blocking=True
             )
+            invalidate_items_cache(target_list)
             
-            replicated_count += 1
             LOGGER.info("Replicated task to smart list %s: %s", target_list, summary)
+            return True
+        
+        # Replicate to all applicable smart lists at once (skip the list the task is already in);
+        # a list configured for several timeframes only gets one copy
+        results = await asyncio.gather(
+            *(replicate_to_list(target_list) for target_list in dict.fromkeys(target_smart_lists)
+              if target_list != source_entity_id)
+        )
+        replicated_count = sum(results)
         
         if replicated_count > 0:
             LOGGER.info("Task replicated to %d smart lists: %s", replicated_count, summary)
@@ -637,11 +813,7 @@ async def move_task_to_correct_list(hass: HomeAssistant, item: dict[str, Any],
     
     try:
         # Parse due date
-        if "T" in due_date_str:
-            due_date = datetime.fromisoformat(due_date_str.replace("Z", "+00:00"))
-            due_date = due_date.replace(tzinfo=None)
-        else:
-            due_date = datetime.strptime(due_date_str, "%Y-%m-%d")
+        due_date = parse_due_date(due_date_str)
         
         # Determine correct timeframe and target list
         timeframe = analyze_task_timeframe(due_date)
@@ -656,17 +828,8 @@ async def move_task_to_correct_list(hass: HomeAssistant, item: dict[str, Any],
             return
         
         # Check if current list is a smart list or fallback list (all should participate in migration)
-        all_smart_lists = [
-            smart_config.get(CONF_DAILY_LIST, ""),
-            smart_config.get(CONF_WEEKLY_LIST, ""),
-            smart_config.get(CONF_MONTHLY_LIST, ""),
-            smart_config.get(CONF_FALLBACK_LIST, "")  # Include fallback list in migration
-        ]
-        
-        # Remove empty strings from the list
-        all_smart_lists = [lst for lst in all_smart_lists if lst]
-        
-        if current_entity_id not in all_smart_lists:
+        if not any(smart_config.get(key) == current_entity_id
+                   for key in SMART_LIST_KEYS + (CONF_FALLBACK_LIST,)):
             # Task is not in a smart list or fallback list, don't move it
             return
         
@@ -698,6 +861,7 @@ async def move_task_to_correct_list(hass: HomeAssistant, item: dict[str, Any],
             add_item_dict,
             blocking=True
         )
+        invalidate_items_cache(correct_list)
         
         # Then remove from current list
         LOGGER.debug("Removing task from %s: %s", current_entity_id, summary)
@@ -711,6 +875,7 @@ async def move_task_to_correct_list(hass: HomeAssistant, item: dict[str, Any],
             },
             blocking=True
         )
+        invalidate_items_cache(current_entity_id)
         
         LOGGER.info("Moved task from %s to %s: %s", current_entity_id, correct_list, summary)
         
@@ -718,18 +883,33 @@ async def move_task_to_correct_list(hass: HomeAssistant, item: dict[str, Any],
         LOGGER.error("Error moving task to correct list: %s", err)
 
 
-async def find_task_in_list(hass: HomeAssistant, entity_id: str, summary: str, due_date: str) -> dict[str, Any] | None:
-    """Find a task with matching summary and due date in a specific list.
+async def get_items_cached(hass: HomeAssistant, entity_id: str, 
+                           ttl: float = GET_ITEMS_CACHE_TTL) -> dict[str, Any] | None:
+    """Fetch todo items for an entity, sharing recent or in-flight fetches.
+    
+    Callers within ttl seconds of each other await the same get_items call.
+    The returned response is shared, so callers must not mutate it.
     
     Args:
         hass: Home Assistant instance
-        entity_id: Todo entity ID to search
-        summary: Task summary to match
-        due_date: Due date to match
+        entity_id: Todo entity ID
+        ttl: Seconds a fetch result may be reused
     
     Returns:
-        Task dictionary if found, None otherwise
+        The get_items service response
     """
+    now = hass.loop.time()
+    cached = GET_ITEMS_CACHE.get(entity_id)
+    if cached and now - cached[0] < ttl:
+        try:
+            # Shield so one cancelled waiter doesn't cancel the fetch for the others
+            return await asyncio.shield(cached[1])
+        except GetItemsFetchCancelled:
+            # The task that started the fetch was cancelled, not this one; fetch again
+            return await get_items_cached(hass, entity_id, ttl)
+    
+    future = hass.loop.create_future()
+    GET_ITEMS_CACHE[entity_id] = (now, future)
     try:
         result = await hass.services.async_call(
             TODO_DOMAIN,
@@ -738,6 +918,82 @@ async def find_task_in_list(hass: HomeAssistant, entity_id: str, summary: str, d
             blocking=True,
             return_response=True
         )
+    except BaseException as err:
+        # Don't let later callers reuse a failed fetch
+        if GET_ITEMS_CACHE.get(entity_id, (None, None))[1] is future:
+            del GET_ITEMS_CACHE[entity_id]
+        # Waiters weren't cancelled themselves, so hand them an error they can retry on
+        # rather than cancelling the shared future
+        future.set_exception(err if isinstance(err, Exception) else GetItemsFetchCancelled())
+        # Mark retrieved so an unawaited failure isn't logged by asyncio
+        future.exception()
+        raise
+    
+    future.set_result(result)
+    return result
+
+
+def invalidate_items_cache(entity_id: str) -> None:
+    """Drop the cached get_items result for an entity after it was modified."""
+    GET_ITEMS_CACHE.pop(entity_id, None)
+
+
+def get_entity_lock(entity_id: str) -> asyncio.Lock:
+    """Return the processing lock for an entity, creating it on first use."""
+    lock = PROCESSING_LOCKS.get(entity_id)
+    if lock is None:
+        lock = PROCESSING_LOCKS[entity_id] = asyncio.Lock()
+    return lock
+
+
+def drop_entity_lock(entity_id: str | None) -> None:
+    """Forget the processing lock for an entity that no longer exists, unless it's held."""
+    lock = PROCESSING_LOCKS.get(entity_id)
+    if lock is not None and not lock.locked():
+        del PROCESSING_LOCKS[entity_id]
+
+
+def is_entity_locked(entity_id: str) -> bool:
+    """Return True while new-item processing or auto-sort holds the lock for this entity."""
+    lock = PROCESSING_LOCKS.get(entity_id)
+    return lock is not None and lock.locked()
+
+
+def create_background_task(hass: HomeAssistant, target: Awaitable[Any], name: str) -> asyncio.Task:
+    """Create a background task, starting it eagerly when Home Assistant supports it.
+    
+    Eager start runs the coroutine up to its first await right away instead of
+    scheduling it with call_soon. Releases before eager_start raise TypeError.
+    
+    Args:
+        hass: Home Assistant instance
+        target: Coroutine to run
+        name: Task name
+    
+    Returns:
+        The created task
+    """
+    try:
+        return hass.async_create_background_task(target, name=name, eager_start=True)
+    except TypeError:
+        return hass.async_create_background_task(target, name=name)
+
+
+async def find_task_in_list(hass: HomeAssistant, entity_id: str, summary: str, due_date: str) -> dict[str, Any] | None:
+    """Find a task with matching summary and due date in a specific list.
+    
+    Args:
+        hass: Home Assistant instance
+        entity_id: Todo entity ID to search
+        summary: Task summary to match
+        due_date: Due date to match
+    
+    Returns:
+        Task dictionary if found, None otherwise
+    """
+    try:
+        # Lookups for several tasks in one burst share a single get_items call
+        result = await get_items_cached(hass, entity_id)
         
         if not result or entity_id not in result or "items" not in result[entity_id]:
             return None
@@ -785,16 +1041,10 @@ async def sync_task_completion_across_lists(hass: HomeAssistant, completed_item:
     # Get ALL todo entities (not just configured smart lists)
     # Because task could exist in any original list + smart list reflections
     todo_entity_ids = [eid for eid in hass.states.async_entity_ids(TODO_DOMAIN)
-                      if hass.states.get(eid) and hass.states.get(eid).state != "unavailable"]
-    
-    synced_count = 0
+                      if (state := hass.states.get(eid)) and state.state != "unavailable"]
     
-    # Check every todo list for this task and mark it complete
-    for entity_id in todo_entity_ids:
-        if entity_id == source_entity_id:
-            # Skip the source list (already completed there)
-            continue
-            
+    async def sync_to_list(entity_id: str) -> bool:
+        """Mark the task completed in one list, returning whether it was found there."""
         try:
             matching_task = await find_task_in_list(hass, entity_id, summary, due_date)
             if matching_task and matching_task.get("status") != "completed":
@@ -808,15 +1058,47 @@ async def sync_task_completion_across_lists(hass: HomeAssistant, completed_item:
                     },
                     blocking=True
                 )
-                synced_count += 1
+                invalidate_items_cache(entity_id)
                 LOGGER.info("Synced task completion to %s: %s", entity_id, summary)
+                return True
         except Exception as err:
             LOGGER.error("Error syncing task completion to %s: %s", entity_id, err)
+        return False
+    
+    # Check every todo list for this task and mark it complete; the lists are independent,
+    # so their lookups and updates run concurrently (skip the source list, already completed there)
+    results = await asyncio.gather(
+        *(sync_to_list(entity_id) for entity_id in todo_entity_ids if entity_id != source_entity_id)
+    )
+    synced_count = sum(results)
     
     if synced_count > 0:
         LOGGER.info("Task completion synced across %d lists: %s", synced_count + 1, summary)  # +1 for source list
 
 
+@lru_cache(maxsize=4096)
+def due_date_sort_key(due_str: str) -> tuple:
+    """Generate the sort key for a todo item's due value.
+    
+    Cached, so an invalid due value is only warned about the first time it's seen.
+    """
+    if not due_str:
+        # Items without due dates go to the end
+        return (1, "")
+    
+    try:
+        # Parse due date/time
+        due_date = parse_due_date(due_str)
+        
+        # Items with due dates go first, sorted by date
+        return (0, due_date)
+        
+    except (ValueError, TypeError):
+        # Invalid due date format, treat as no due date
+        LOGGER.warning("Invalid due date format for item: %s", due_str)
+        return (1, "")
+
+
 def sort_todo_items_by_due_date(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Sort todo items by due date with earliest due dates first.
     
@@ -829,40 +1111,131 @@ def sort_todo_items_by_due_date(items: list[dict[str, Any]]) -> list[dict[str, A
     Returns:
         Sorted list of todo items
     """
-    def get_sort_key(item: dict[str, Any]) -> tuple:
-        """Generate sort key for todo item."""
-        due_str = item.get("due", "")
-        
-        if not due_str:
-            # Items without due dates go to the end
-            return (1, "")
-        
-        try:
-            # Parse due date/time
-            if "T" in due_str:
-                # Due datetime format
-                due_date = datetime.fromisoformat(due_str.replace("Z", "+00:00"))
-                # Convert to naive datetime for comparison
-                due_date = due_date.replace(tzinfo=None)
-            else:
-                # Due date only format
-                due_date = datetime.strptime(due_str, "%Y-%m-%d")
-            
-            # Items with due dates go first, sorted by date
-            return (0, due_date)
-            
-        except (ValueError, TypeError):
-            # Invalid due date format, treat as no due date
-            LOGGER.warning("Invalid due date format for item: %s", due_str)
-            return (1, "")
-    
-    # Sort items using the sort key
-    sorted_items = sorted(items, key=get_sort_key)
+    # One cached key lookup per item; sorting indices by the precomputed keys keeps it stable
+    keys = [due_date_sort_key(item.get("due", "")) for item in items]
+    sorted_items = [items[index] for index in sorted(range(len(items)), key=keys.__getitem__)]
     
     LOGGER.debug("Sorted %d items by due date", len(sorted_items))
     return sorted_items
 
 
+def summaries_and_uids(items: list[dict[str, Any]]) -> tuple[list[str], list[str]]:
+    """Return the summaries of all items and the UIDs of those that have one, in list order."""
+    summaries = []
+    uids = []
+    for item in items:
+        summaries.append(item.get("summary", ""))
+        uid = item.get("uid")
+        if uid:
+            uids.append(uid)
+    return summaries, uids
+
+
+def find_uids_in_place(current_uids: list[str], sorted_uids: list[str]) -> set[str]:
+    """Find the items that don't need to move when reordering a list.
+    
+    The longest run of items whose current positions are already in sorted
+    order (a longest increasing subsequence) can stay where it is; moving
+    every other item after its sorted predecessor gives the sorted order
+    with as few moves as possible.
+    
+    Args:
+        current_uids: Item UIDs in their current order
+        sorted_uids: Item UIDs in the desired order
+    
+    Returns:
+        Set of UIDs that can stay in place
+    """
+    current_positions = {uid: index for index, uid in enumerate(current_uids)}
+    candidates = [uid for uid in sorted_uids if uid in current_positions]
+    
+    # tail_indexes[k]: index into candidates of the smallest position ending an increasing run of length k + 1
+    tail_positions: list[int] = []
+    tail_indexes: list[int] = []
+    predecessors: list[int] = []
+    for index, uid in enumerate(candidates):
+        position = current_positions[uid]
+        length = bisect_left(tail_positions, position)
+        predecessors.append(tail_indexes[length - 1] if length else -1)
+        if length == len(tail_positions):
+            tail_positions.append(position)
+            tail_indexes.append(index)
+        else:
+            tail_positions[length] = position
+            tail_indexes[length] = index
+    
+    uids_in_place = set()
+    index = tail_indexes[-1] if tail_indexes else -1
+    while index >= 0:
+        uids_in_place.add(candidates[index])
+        index = predecessors[index]
+    return uids_in_place
+
+
+def find_todo_entity(hass: HomeAssistant, entity_id: str) -> TodoListEntity | None:
+    """Find the todo entity object for an entity_id.
+    
+    Found entities are remembered in TODO_ENTITY_CACHE until the entity goes
+    away or its entity registry entry changes.
+    
+    Args:
+        hass: Home Assistant instance
+        entity_id: Todo entity ID
+    
+    Returns:
+        The entity object, or None if it can't be found
+    """
+    entity_ref = TODO_ENTITY_CACHE.get(entity_id)
+    if entity_ref is not None:
+        actual_entity = entity_ref()
+        if actual_entity is not None and actual_entity.entity_id == entity_id:
+            return actual_entity
+        del TODO_ENTITY_CACHE[entity_id]
+    
+    # Try multiple methods to get the actual entity object
+    actual_entity = None
+    
+    # Method 1: Direct lookup on the todo EntityComponent (O(1), returns None if missing)
+    entity_component = hass.data.get("entity_components", {}).get(TODO_DOMAIN)
+    if entity_component:
+        actual_entity = entity_component.get_entity(entity_id)
+    
+    # Method 2: Try to get from entity platform
+    if not actual_entity:
+        try:
+            platforms = hass.data.get("entity_platform", {})
+            if TODO_DOMAIN in platforms:
+                for platform in platforms[TODO_DOMAIN]:
+                    for entity in platform.entities:
+                        if entity.entity_id == entity_id:
+                            actual_entity = entity
+                            break
+                    if actual_entity:
+                        break
+        except Exception as e:
+            LOGGER.debug("Method 2 failed: %s", e)
+    
+    if actual_entity:
+        TODO_ENTITY_CACHE[entity_id] = weakref.ref(actual_entity)
+    return actual_entity
+
+
+@callback
+def entity_registry_updated_listener(event: Event) -> None:
+    """Forget cached per-entity state when an entity's registry entry changes.
+    
+    The cached todo entity object is dropped on any change; the processing
+    lock only when the entity is removed or renamed away from its old ID.
+    """
+    TODO_ENTITY_CACHE.pop(event.data.get("entity_id"), None)
+    if event.data.get("action") == "remove":
+        drop_entity_lock(event.data.get("entity_id"))
+    if "old_entity_id" in event.data:
+        # Renamed entity
+        TODO_ENTITY_CACHE.pop(event.data["old_entity_id"], None)
+        drop_entity_lock(event.data["old_entity_id"])
+
+
 async def apply_auto_sort_if_enabled(hass: HomeAssistant, entity_id: str, settings: dict[str, Any]) -> None:
     """Apply auto-sort to a todo entity if enabled in settings.
     
@@ -876,365 +1249,382 @@ async def apply_auto_sort_if_enabled(hass: HomeAssistant, entity_id: str, settin
         return
     
     # Check if already processing this entity to prevent race conditions
-    if entity_id in PROCESSING_LOCKS:
+    lock = get_entity_lock(entity_id)
+    if lock.locked():
         LOGGER.debug("Already processing %s, skipping auto-sort", entity_id)
         return
     
-    try:
-        # Get current items
-        result = await hass.services.async_call(
-            TODO_DOMAIN,
-            "get_items",
-            {"entity_id": entity_id},
-            blocking=True,
-            return_response=True
-        )
+    async with lock:
+        try:
+            # Get current items
+            result = await hass.services.async_call(
+                TODO_DOMAIN,
+                "get_items",
+                {"entity_id": entity_id},
+                blocking=True,
+                return_response=True
+            )
         
-        if not result or entity_id not in result or "items" not in result[entity_id]:
-            LOGGER.debug("No items found for auto-sort: %s", entity_id)
-            return
+            if not result or entity_id not in result or "items" not in result[entity_id]:
+                LOGGER.debug("No items found for auto-sort: %s", entity_id)
+                return
         
-        items = result[entity_id]["items"]
+            items = result[entity_id]["items"]
         
-        if len(items) <= 1:
-            LOGGER.debug("Not enough items to sort for %s", entity_id)
-            return
+            if len(items) <= 1:
+                LOGGER.debug("Not enough items to sort for %s", entity_id)
+                return
         
-        # Sort items by due date
-        sorted_items = sort_todo_items_by_due_date(items)
+            # Only UIDs and due dates decide the sorted order; if they're unchanged since the
+            # list was last found sorted, skip sorting it again
+            order_hash = hash(tuple((item.get("uid"), item.get("due")) for item in items))
+            if SORTED_ORDER_HASHES.get(entity_id) == order_hash:
+                LOGGER.debug("Items already in correct order for %s", entity_id)
+                return
         
-        # Check if reordering is needed by comparing current vs sorted order
-        current_order = [item.get("summary", "") for item in items]
-        sorted_order = [item.get("summary", "") for item in sorted_items]
+            # Sort items by due date
+            sorted_items = sort_todo_items_by_due_date(items)
         
-        if current_order == sorted_order:
-            LOGGER.debug("Items already in correct order for %s", entity_id)
-            return
+            # Check if reordering is needed; sorted() keeps the same dict objects,
+            # so an identity compare bails out at the first moved item
+            if all(a is b for a, b in zip(items, sorted_items)):
+                LOGGER.debug("Items already in correct order for %s", entity_id)
+                SORTED_ORDER_HASHES[entity_id] = order_hash
+                return
         
-        LOGGER.debug("Reordering items for %s: %s -> %s", entity_id, current_order, sorted_order)
+            # One pass over each list collects the summaries (for logging) and the UIDs
+            current_order, current_uids = summaries_and_uids(items)
+            sorted_order, sorted_uids = summaries_and_uids(sorted_items)
         
-        # TODO: Manual move detection placeholder
-        # Future enhancement: detect if user manually moved items and add "pin" functionality
-        # to prevent auto-sorting of manually positioned items
+            LOGGER.debug("Reordering items for %s: %s -> %s", entity_id, current_order, sorted_order)
         
-        # Use Home Assistant's move_item service for smooth reordering (no UI flicker)
-        LOGGER.info("Auto-sort will reorder %s from %s to %s", 
-                   entity_id, current_order, sorted_order)
+            # TODO: Manual move detection placeholder
+            # Future enhancement: detect if user manually moved items and add "pin" functionality
+            # to prevent auto-sorting of manually positioned items
         
-        try:
-            # Build a mapping of current items by UID for efficient lookups
-            current_items_by_uid = {item.get("uid"): item for item in items if item.get("uid")}
-            sorted_uids = [item.get("uid") for item in sorted_items if item.get("uid")]
-            current_uids = [item.get("uid") for item in items if item.get("uid")]
+            # Use Home Assistant's move_item service for smooth reordering (no UI flicker)
+            LOGGER.info("Auto-sort will reorder %s from %s to %s", 
+                       entity_id, current_order, sorted_order)
+        
+            try:
+                LOGGER.debug("Current UIDs: %s", current_uids)
+                LOGGER.debug("Sorted UIDs: %s", sorted_uids)
+            
+                # Check if we have UIDs for all items
+                if len(sorted_uids) != len(sorted_items):
+                    LOGGER.warning("Some items missing UIDs, falling back to summary-based reordering")
+                    # Fallback: use item summary to identify items for move_item service
+                    # Note: This is less reliable than UIDs but may still work
+                
+                # Items already in sorted order relative to each other stay put; only the rest move
+                uids_in_place = find_uids_in_place(current_uids, sorted_uids)
             
-            LOGGER.debug("Current UIDs: %s", current_uids)
-            LOGGER.debug("Sorted UIDs: %s", sorted_uids)
+                # Look up the entity object once for all the moves below
+                actual_entity = find_todo_entity(hass, entity_id)
             
-            # Check if we have UIDs for all items
-            if len(sorted_uids) != len(sorted_items):
-                LOGGER.warning("Some items missing UIDs, falling back to summary-based reordering")
-                # Fallback: use item summary to identify items for move_item service
-                # Note: This is less reliable than UIDs but may still work
-                
-            # Reorder items using move_item service
-            moves_made = 0
-            previous_uid = None  # First item goes to position 1 (previous_uid=None)
+                # Reorder items using move_item service
+                moves_made = 0
+                previous_uid = None  # First item goes to position 1 (previous_uid=None)
             
-            for i, target_item in enumerate(sorted_items):
-                target_uid = target_item.get("uid")
-                target_summary = target_item.get("summary", "")
+                for i, target_item in enumerate(sorted_items):
+                    target_uid = target_item.get("uid")
+                    target_summary = target_item.get("summary", "")
                 
-                if not target_uid and not target_summary:
-                    LOGGER.warning("Item has no UID or summary, skipping")
-                    continue
+                    if not target_uid and not target_summary:
+                        LOGGER.warning("Item has no UID or summary, skipping")
+                        continue
                 
-                # Check if this item is already in the correct position
-                current_position = None
-                if target_uid and target_uid in current_uids:
-                    current_position = current_uids.index(target_uid)
+                    # Check if this item can stay where it is
+                    if target_uid in uids_in_place:
+                        # Item is already in correct position
+                        LOGGER.debug("Item '%s' already in correct position %d", target_summary, i)
+                        previous_uid = target_uid
+                        continue
                 
-                if current_position == i:
-                    # Item is already in correct position
-                    LOGGER.debug("Item '%s' already in correct position %d", target_summary, i)
-                    previous_uid = target_uid
-                    continue
+                    # Item needs to be moved
+                    LOGGER.debug("Moving item '%s' to position %d (after UID: %s)", 
+                               target_summary, i, previous_uid)
                 
-                # Item needs to be moved
-                LOGGER.debug("Moving item '%s' to position %d (after UID: %s)", 
-                           target_summary, i, previous_uid)
-                
-                try:
-                    # Try multiple methods to get the actual entity object
-                    actual_entity = None
-                    
-                    # Method 1: Try to get from entity platform
-                    try:
-                        from homeassistant.helpers import entity_platform
-                        platforms = hass.data.get("entity_platform", {})
-                        if TODO_DOMAIN in platforms:
-                            for platform in platforms[TODO_DOMAIN]:
-                                for entity in platform.entities:
-                                    if entity.entity_id == entity_id:
-                                        actual_entity = entity
-                                        break
-                                if actual_entity:
-                                    break
-                    except Exception as e:
-                        LOGGER.debug("Method 1 failed: %s", e)
-                    
-                    # Method 2: Try accessing via domain data
-                    if not actual_entity:
-                        try:
-                            domain_data = hass.data.get(TODO_DOMAIN, {})
-                            if isinstance(domain_data, dict):
-                                for key, value in domain_data.items():
-                                    if hasattr(value, 'entity_id') and value.entity_id == entity_id:
-                                        actual_entity = value
-                                        break
-                        except Exception as e:
-                            LOGGER.debug("Method 2 failed: %s", e)
-                    
-                    # Method 3: Try the entity registry approach
-                    if not actual_entity:
-                        try:
-                            from homeassistant.helpers import entity_registry as er
-                            registry = er.async_get(hass)
-                            entity_entry = registry.async_get(entity_id)
-                            if entity_entry:
-                                # Try to find the actual entity through the entity component
-                                entity_component = hass.data.get("entity_components", {}).get(TODO_DOMAIN)
-                                if entity_component:
-                                    actual_entity = entity_component.get_entity(entity_id)
-                        except Exception as e:
-                            LOGGER.debug("Method 3 failed: %s", e)
-                    
-                    # Method 4: Fallback to service call if direct entity access fails
-                    if not actual_entity:
-                        try:
-                            LOGGER.debug("Trying service call approach as fallback for %s", entity_id)
-                            await hass.services.async_call(
-                                TODO_DOMAIN,
-                                "move_item",
-                                {
-                                    "entity_id": entity_id,
-                                    "uid": target_uid,
-                                    "previous_uid": previous_uid
-                                }
-                            )
-                            moves_made += 1
-                            LOGGER.debug("Successfully moved item '%s' via service call", target_summary)
-                            
-                            # Update our tracking of current order
-                            if target_uid and target_uid in current_uids:
-                                current_uids.remove(target_uid)
-                                current_uids.insert(i, target_uid)
-                            previous_uid = target_uid
-                            continue
+                    try:
+                        # Fallback to service call if direct entity access fails
+                        if not actual_entity:
+                            try:
+                                LOGGER.debug("Trying service call approach as fallback for %s", entity_id)
+                                await hass.services.async_call(
+                                    TODO_DOMAIN,
+                                    "move_item",
+                                    {
+                                        "entity_id": entity_id,
+                                        "uid": target_uid,
+                                        "previous_uid": previous_uid
+                                    }
+                                )
+                                moves_made += 1
+                                LOGGER.debug("Successfully moved item '%s' via service call", target_summary)
+                                previous_uid = target_uid
+                                continue
                             
-                        except Exception as service_error:
-                            LOGGER.error("Could not move todo item %s via service call: %s", target_summary, service_error)
-                            LOGGER.error("Could not access todo entity %s using any method", entity_id)
-                            continue
-                    
-                    # Check if the entity supports MOVE_TODO_ITEM
-                    if not hasattr(actual_entity, 'supported_features') or \
-                       not (actual_entity.supported_features & TodoListEntityFeature.MOVE_TODO_ITEM):
-                        LOGGER.warning("Entity %s does not support MOVE_TODO_ITEM feature", entity_id)
-                        break
+                            except ServiceNotFound:
+                                raise
+                            except Exception as service_error:
+                                LOGGER.error("Could not move todo item %s via service call: %s", target_summary, service_error)
+                                LOGGER.error("Could not access todo entity %s using any method", entity_id)
+                                continue
                     
-                    LOGGER.debug("Successfully found entity %s, calling async_move_todo_item", entity_id)
+                        # Check if the entity supports MOVE_TODO_ITEM
+                        if not hasattr(actual_entity, 'supported_features') or \
+                           not (actual_entity.supported_features & TodoListEntityFeature.MOVE_TODO_ITEM):
+                            LOGGER.warning("Entity %s does not support MOVE_TODO_ITEM feature", entity_id)
+                            break
                     
-                    # Call the move method directly on the entity
-                    await actual_entity.async_move_todo_item(
-                        uid=target_uid,
-                        previous_uid=previous_uid
-                    )
+                        LOGGER.debug("Successfully found entity %s, calling async_move_todo_item", entity_id)
                     
-                    moves_made += 1
-                    LOGGER.debug("Successfully moved item '%s'", target_summary)
+                        # Call the move method directly on the entity
+                        await actual_entity.async_move_todo_item(
+                            uid=target_uid,
+                            previous_uid=previous_uid
+                        )
                     
-                    # Update our tracking of current order
-                    if target_uid and target_uid in current_uids:
-                        current_uids.remove(target_uid)
-                        current_uids.insert(i, target_uid)
+                        moves_made += 1
+                        LOGGER.debug("Successfully moved item '%s'", target_summary)
                     
-                except Exception as move_err:
-                    LOGGER.error("Failed to move item '%s': %s", target_summary, move_err)
-                    # Check if move_todo_item service doesn't exist
-                    if "not found" in str(move_err).lower() or "Unknown service" in str(move_err):
+                    except ServiceNotFound:
                         LOGGER.warning("move_todo_item service not available, todo provider may not support reordering")
                         break
-                    # Continue with other items even if one fails
+                    except Exception as move_err:
+                        LOGGER.error("Failed to move item '%s': %s", target_summary, move_err)
+                        # Continue with other items even if one fails
                 
-                previous_uid = target_uid
+                    previous_uid = target_uid
             
-            LOGGER.info("Auto-sort completed: made %d moves for %s", moves_made, entity_id)
+                LOGGER.info("Auto-sort completed: made %d moves for %s", moves_made, entity_id)
             
-        except Exception as reorder_err:
-            LOGGER.error("Error during auto-sort reordering for %s: %s", entity_id, reorder_err)
+            except Exception as reorder_err:
+                LOGGER.error("Error during auto-sort reordering for %s: %s", entity_id, reorder_err)
             
-            # If move_item service fails completely, we could fall back to remove/re-add
-            # But for now, we'll just log the error and continue
-            if "Unknown service" in str(reorder_err) or "not found" in str(reorder_err).lower():
-                LOGGER.warning("move_item service not supported by this todo provider")
-            else:
-                LOGGER.warning("Auto-sort reordering failed, items remain in original order")
+                # If move_item service fails completely, we could fall back to remove/re-add
+                # But for now, we'll just log the error and continue
+                if "Unknown service" in str(reorder_err) or "not found" in str(reorder_err).lower():
+                    LOGGER.warning("move_item service not supported by this todo provider")
+                else:
+                    LOGGER.warning("Auto-sort reordering failed, items remain in original order")
         
-        LOGGER.info("Auto-sorted %d items for %s", len(sorted_items), entity_id)
+            LOGGER.info("Auto-sorted %d items for %s", len(sorted_items), entity_id)
         
-    except Exception as err:
-        LOGGER.error("Error during auto-sort for %s: %s", entity_id, err)
+        except Exception as err:
+            LOGGER.error("Error during auto-sort for %s: %s", entity_id, err)
 
 
-async def apply_auto_sort_after_delay(hass: HomeAssistant, entity_id: str, settings: dict[str, Any]) -> None:
-    """Apply auto-sort after a short delay to allow other processing to complete.
+def get_entity_settings(options: dict[str, Any], entity_id: str, entry_id: str | None = None) -> dict[str, Any]:
+    """Get settings for a specific entity from options.
     
-    Args:
-        hass: Home Assistant instance
-        entity_id: Todo entity ID to sort
-        settings: Entity settings dictionary
+    When entry_id is given the result is cached until the entry's options change.
+    The returned dict is shared between callers and must not be modified.
     """
-    import asyncio
-    LOGGER.debug("Auto-sort delayed execution starting for %s", entity_id)
-    # Wait a short time to allow other processing to complete
-    await asyncio.sleep(1)
-    await apply_auto_sort_if_enabled(hass, entity_id, settings)
-
-
-def get_entity_settings(options: dict[str, Any], entity_id: str) -> dict[str, Any]:
-    """Get settings for a specific entity from options."""
+    cache_key = (entry_id, entity_id)
+    if entry_id is not None:
+        cached = ENTITY_SETTINGS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+    
     entity_key = entity_id.replace(".", "_")
-    return {
+    settings = {
         "auto_due_parsing": options.get(f"{entity_key}_auto_due_parsing", True),
         "auto_sort": options.get(f"{entity_key}_auto_sort", False),
         "process_recurring": options.get(f"{entity_key}_process_recurring", False),
         "clear_days": options.get(f"{entity_key}_clear_days", -1),
     }
+    if entry_id is not None:
+        ENTITY_SETTINGS_CACHE[cache_key] = settings
+    return settings
+
+
+def clear_entity_settings_cache(entry_id: str) -> None:
+    """Drop cached entity settings for a config entry."""
+    for cache_key in [key for key in ENTITY_SETTINGS_CACHE if key[0] == entry_id]:
+        del ENTITY_SETTINGS_CACHE[cache_key]
+    SMART_LIST_SETTINGS_CACHE.pop(entry_id, None)
+
+
+@callback
+def todo_state_event_filter(event_data: Any) -> bool:
+    """Let only todo entity state changes through to state_changed_listener.
+    
+    Runs on the event bus before the listener is scheduled. Newer Home
+    Assistant versions pass the event data, older ones pass the Event.
+    """
+    data = getattr(event_data, "data", event_data)
+    return data.get("entity_id", "").startswith("todo.")
 
 
 @callback
 def state_changed_listener(hass: HomeAssistant, entry: ConfigEntry, evt: Event) -> None:
     """Handle state changed events for todo entities - only process newly added items."""
-    entity_id = evt.data.get("entity_id", "")
-    if not entity_id.startswith("todo."):
+    entity_id = evt.data.get("entity_id")
+    if not entity_id or not entity_id.startswith("todo."):
         return
 
-    old_state = evt.data.get("old_state")
     new_state = evt.data.get("new_state")
-    
     if not new_state or new_state.state == "unavailable":
         return
 
-    # Get settings for this entity
-    settings = get_entity_settings(entry.options, entity_id)
-    smart_config = get_smart_list_settings(entry.options)
-    
-    # Skip processing if auto_due_parsing is disabled for this entity and smart lists are disabled
-    if not settings["auto_due_parsing"] and not smart_config.get(CONF_ENABLE_SMART_LISTS, False):
-        return
+    old_state = evt.data.get("old_state")
+
+    # The list changed, so any cached get_items result for it is stale
+    invalidate_items_cache(entity_id)
+
+    # Checked once; most todo state changes are skipped below, so avoid debug calls when disabled
+    debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
 
     # Debug: Log the state change details
-    LOGGER.debug("State change for %s:", entity_id)
-    if old_state:
-        LOGGER.debug("  Old state: %s, attributes: %s", old_state.state, getattr(old_state, 'attributes', {}))
-    if new_state:
-        LOGGER.debug("  New state: %s, attributes: %s", new_state.state, getattr(new_state, 'attributes', {}))
+    if debug_enabled:
+        LOGGER.debug("State change for %s:", entity_id)
+        if old_state:
+            LOGGER.debug("  Old state: %s, attributes: %s", old_state.state, old_state.attributes)
+        LOGGER.debug("  New state: %s, attributes: %s", new_state.state, new_state.attributes)
 
     # Try multiple methods to detect new items
     should_process = False
     
     # Method 1: Check for count attribute
-    old_count = 0
-    new_count = 0
-    
-    if old_state and hasattr(old_state, 'attributes') and 'count' in old_state.attributes:
-        old_count = old_state.attributes.get('count', 0)
-    
-    if hasattr(new_state, 'attributes') and 'count' in new_state.attributes:
-        new_count = new_state.attributes.get('count', 0)
+    old_has_count = old_state is not None and 'count' in old_state.attributes
+    old_count = old_state.attributes.get('count', 0) if old_has_count else 0
+    new_count = new_state.attributes.get('count', 0)
     
     if new_count > old_count:
-        LOGGER.debug("Item count increased: %d -> %d", old_count, new_count)
+        if debug_enabled:
+            LOGGER.debug("Item count increased: %d -> %d", old_count, new_count)
         should_process = True
     
     # Method 2: If no count attribute, check for any state change (fallback)
-    elif not (old_state and hasattr(old_state, 'attributes') and 'count' in old_state.attributes):
-        LOGGER.debug("No count attribute found, using fallback detection")
+    elif not old_has_count:
+        if debug_enabled:
+            LOGGER.debug("No count attribute found, using fallback detection")
         # Process any state change as potential new item (more permissive)
         should_process = True
     
     if not should_process:
-        LOGGER.debug("No new items detected, skipping processing")
+        if debug_enabled:
+            LOGGER.debug("No new items detected, skipping processing")
         return
     
     # Check if already processing this entity
-    if entity_id in PROCESSING_LOCKS:
-        LOGGER.debug("Already processing %s, skipping", entity_id)
+    if is_entity_locked(entity_id):
+        if debug_enabled:
+            LOGGER.debug("Already processing %s, skipping", entity_id)
+        return
+
+    # Get settings for this entity
+    settings = get_entity_settings(entry.options, entity_id, entry.entry_id)
+    smart_config = get_smart_list_settings(entry.options, entry.entry_id)
+    
+    # Skip processing if auto_due_parsing is disabled for this entity and smart lists are disabled
+    if not settings["auto_due_parsing"] and not smart_config.get(CONF_ENABLE_SMART_LISTS, False):
         return
     
     LOGGER.debug("New item detected for %s (count: %d -> %d)", entity_id, old_count, new_count)
 
-    # Create background task to process the new item (includes smart list processing)
-    hass.async_create_background_task(
-        process_new_todo_item(hass, entity_id, settings, smart_config),
-        name=f"todo_magic_new_item_{entity_id}"
-    )
+    # Collect the work for this change; the entity worker runs it in ENTITY_WORK_ORDER
+    work: dict[str, Callable[[], Awaitable[None]]] = {}
+
+    # Process the new item (includes smart list processing)
+    work["new_item"] = partial(process_new_todo_item, hass, entity_id, settings, smart_config)
     
     # Also check for completed recurring tasks if recurring processing is enabled
     # IMPORTANT: Only run recurring task logic on primary lists (not smart lists) to prevent duplicates
     # TODO: When we clean this up, abstract the "is smart list" logic into a helper function
     if settings.get("process_recurring", False):
-        smart_config = get_smart_list_settings(entry.options)
-        
         # Check if this entity is a smart list (reflection only)
         is_smart_list = False
         if smart_config.get(CONF_ENABLE_SMART_LISTS, False):
-            smart_lists = [
-                smart_config.get(CONF_DAILY_LIST, ""),
-                smart_config.get(CONF_WEEKLY_LIST, ""),
-                smart_config.get(CONF_MONTHLY_LIST, "")
-            ]
-            smart_lists = [lst for lst in smart_lists if lst]  # Remove empty strings
-            is_smart_list = entity_id in smart_lists
+            is_smart_list = any(smart_config[key] == entity_id for key in SMART_LIST_KEYS)
         
         if not is_smart_list:
             # Only run recurring logic on non-smart lists (primary lists)
-            hass.async_create_background_task(
-                check_for_completed_recurring_tasks(hass, entity_id, settings),
-                name=f"todo_magic_recurring_{entity_id}"
-            )
+            work["recurring"] = partial(check_for_completed_recurring_tasks, hass, entity_id, settings)
         else:
             LOGGER.debug("Skipping recurring task processing for smart list %s (prevents duplicates)", entity_id)
     
     # Check for completed tasks that need to be synced across smart lists
     if smart_config.get(CONF_ENABLE_SMART_LISTS, False):
-        hass.async_create_background_task(
-            process_smart_list_task_completion(hass, entity_id, smart_config),
-            name=f"todo_magic_smart_completion_{entity_id}"
-        )
+        work["smart_completion"] = partial(process_smart_list_task_completion, hass, entity_id, smart_config)
     
-    # Create separate background task for auto-sort to run after other processing
+    # Auto-sort runs after the processing above has finished
     if settings.get("auto_sort", False):
         LOGGER.debug("Triggering auto-sort for %s after state change", entity_id)
-        hass.async_create_background_task(
-            apply_auto_sort_after_delay(hass, entity_id, settings),
-            name=f"todo_magic_auto_sort_{entity_id}"
-        )
+        work["auto_sort"] = partial(apply_auto_sort_if_enabled, hass, entity_id, settings)
     
-    # Create background task for immediate auto-clear if enabled (clear_days = 0)
+    # Immediate auto-clear if enabled (clear_days = 0)
     clear_days = settings.get("clear_days", -1)
     LOGGER.debug("Auto-clear settings for %s: clear_days=%s, all_settings=%s", entity_id, clear_days, settings)
     if clear_days == 0:
         LOGGER.debug("Triggering immediate auto-clear for %s after state change", entity_id)
-        hass.async_create_background_task(
-            clear_completed_tasks_if_enabled(hass, entity_id, settings),
-            name=f"todo_magic_auto_clear_{entity_id}"
+        work["auto_clear"] = partial(clear_completed_tasks_if_enabled, hass, entity_id, settings)
+
+    enqueue_entity_work(hass, entity_id, work)
+
+
+def enqueue_entity_work(hass: HomeAssistant, entity_id: str, 
+                        work: dict[str, Callable[[], Awaitable[None]]]) -> None:
+    """Queue work for an entity, starting its worker task on first use.
+    
+    Args:
+        hass: Home Assistant instance
+        entity_id: Todo entity ID the work applies to
+        work: Mapping of work kind to coroutine factory
+    """
+    queue = ENTITY_QUEUES.get(entity_id)
+    if queue is None:
+        queue = ENTITY_QUEUES[entity_id] = asyncio.Queue()
+    
+    queue.put_nowait(work)
+    
+    worker = ENTITY_WORKERS.get(entity_id)
+    if worker is None or worker.done():
+        ENTITY_WORKERS[entity_id] = create_background_task(
+            hass,
+            entity_worker(entity_id, queue),
+            name=f"todo_magic_worker_{entity_id}"
         )
 
 
+async def entity_worker(entity_id: str, queue: asyncio.Queue) -> None:
+    """Run queued work for one entity, one batch at a time.
+    
+    Work queued while a batch runs is drained into the next batch; a later
+    entry replaces an earlier one of the same kind.
+    
+    Args:
+        entity_id: Todo entity ID this worker serves
+        queue: Work queue for the entity
+    """
+    while True:
+        work = await queue.get()
+        while not queue.empty():
+            work.update(queue.get_nowait())
+        
+        for kind in ENTITY_WORK_ORDER:
+            job = work.get(kind)
+            if job is None:
+                continue
+            try:
+                await job()
+            except Exception as err:
+                LOGGER.error("Error running %s work for %s: %s", kind, entity_id, err)
+
+
+def cancel_entity_workers() -> None:
+    """Cancel all entity worker tasks and drop their queues."""
+    for worker in ENTITY_WORKERS.values():
+        worker.cancel()
+    ENTITY_WORKERS.clear()
+    ENTITY_QUEUES.clear()
+
+
 async def options_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     LOGGER.debug("Options updated for Todo Magic integration")
+    clear_entity_settings_cache(entry.entry_id)
     # No need to reload the entire integration - the listeners will pick up the new settings automatically
 
 
@@ -1244,20 +1634,16 @@ async def options_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> No
 async def process_new_todo_item(hass: HomeAssistant, entity_id: str, settings: dict[str, Any], smart_config: dict[str, Any] | None = None) -> None:
     """Process the newest todo item for the given entity."""
     # Add processing lock
-    if entity_id in PROCESSING_LOCKS:
+    lock = get_entity_lock(entity_id)
+    if lock.locked():
         LOGGER.debug("Already processing %s, aborting", entity_id)
         return
     
-    PROCESSING_LOCKS.add(entity_id)
+    # Uncontended after the locked() check, so this acquires without waiting
+    await lock.acquire()
     
     try:
-        result = await hass.services.async_call(
-            TODO_DOMAIN,
-            "get_items",
-            {"entity_id": entity_id},
-            blocking=True,
-            return_response=True
-        )
+        result = await get_items_cached(hass, entity_id)
 
         LOGGER.debug("get_items result for new item processing: %s", result)
 
@@ -1273,9 +1659,11 @@ async def process_new_todo_item(hass: HomeAssistant, entity_id: str, settings: d
             LOGGER.debug("No items to process for %s", entity_id)
             return
         
-        # Find items that might need processing
+        # Find the first item that needs processing
         # Look for items without due dates that contain date patterns OR repeat patterns
-        candidates = []
+        new_item = None
+        summary_split = []
+        matched_repeat = None  # (word, repeat_info) when the hit was a repeat pattern
         for item in items:
             if "uid" not in item:
                 continue
@@ -1292,6 +1680,11 @@ async def process_new_todo_item(hass: HomeAssistant, entity_id: str, settings: d
             if task_key in NEWLY_CREATED_RECURRING_TASKS:
                 LOGGER.debug("Skipping reprocessing of newly created recurring task: %s", summary)
                 continue
+            
+            # Skip items already scanned without finding a pattern; editing the summary changes the key
+            scan_key = f"{entity_id}:{item['uid']}:{summary}"
+            if scan_key in ITEMS_WITHOUT_DATE_PATTERN:
+                continue
                 
             # Check if summary contains potential date patterns OR repeat patterns
             cleaned_summary = remove_date_prefixes(summary)
@@ -1302,10 +1695,15 @@ async def process_new_todo_item(hass: HomeAssistant, entity_id: str, settings: d
             
             # Check individual words first
             for word in words:
-                if (parse_natural_language_date(word) or 
-                    re.match(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', word) or
-                    re.match(r'\d{4}-\d{1,2}-\d{1,2}', word) or
-                    parse_repeat_pattern(word)):  # ADD THIS LINE - check for repeat patterns!
+                if looks_like_date_word(word) and (
+                    parse_natural_language_date(word) or 
+                    DATE_WORD_PATTERN.match(word)):
+                    has_date_pattern = True
+                    break
+                # Check for repeat patterns, keeping the parse for reuse below
+                word_repeat_info = parse_repeat_pattern(word)
+                if word_repeat_info:
+                    matched_repeat = (word, word_repeat_info)
                     has_date_pattern = True
                     break
             
@@ -1313,50 +1711,50 @@ async def process_new_todo_item(hass: HomeAssistant, entity_id: str, settings: d
             if not has_date_pattern:
                 for i in range(len(words) - 1):
                     two_words = f"{words[i]} {words[i+1]}"
-                    if parse_natural_language_date(two_words):
+                    if looks_like_date_word(two_words) and parse_natural_language_date(two_words):
                         has_date_pattern = True
                         break
             
             if has_date_pattern:
-                candidates.append(item)
-        
-        LOGGER.debug("Found %d candidate items for processing: %s", len(candidates), [item.get("summary") for item in candidates])
+                # Process the first candidate (could be improved to find "newest" based on other criteria)
+                new_item = item
+                summary_split = words
+                break
+            ITEMS_WITHOUT_DATE_PATTERN.add(scan_key)
         
-        if not candidates:
+        if new_item is None:
             LOGGER.debug("No items with date patterns found for %s", entity_id)
             return
             
-        # Process the first candidate (could be improved to find "newest" based on other criteria)
-        new_item = candidates[0]
-            
         LOGGER.debug("Processing new item: %s", new_item)
         
         summary = new_item.get("summary", "")
         
-        # Remove date prefixes like 'in' and ':' before processing
-        cleaned_summary = remove_date_prefixes(summary)
-        
-        # Check if there is a date as one of the last words in the summary
-        summary_split = cleaned_summary.split()
+        # summary_split holds the prefix-cleaned words of the summary from the scan above;
+        # check if there is a date as one of the last words in the summary
 
         # Skip if summary is empty or too short
         if len(summary_split) == 0:
             return
 
-        current_element = -1
+        # Trailing tokens (repeat pattern, time, 'at'/'@', date) are popped off the end as they are recognized
+        tail = list(summary_split)
         repeat_string = ""
         repeat_info = None
         time_string = ""
         calculated_due_date = None
         
-        # Check bounds before accessing elements - Parse repeat pattern FIRST
-        if len(summary_split) >= abs(current_element) and summary_split[current_element].startswith("[") and summary_split[current_element].endswith("]"):
-            repeat_string = summary_split[current_element]
-            repeat_info = parse_repeat_pattern(repeat_string)
+        # Parse repeat pattern FIRST
+        if tail and tail[-1].startswith("[") and tail[-1].endswith("]"):
+            repeat_string = tail.pop()
+            if matched_repeat and matched_repeat[0] == repeat_string:
+                repeat_info = matched_repeat[1]
+            else:
+                repeat_info = parse_repeat_pattern(repeat_string)
             if repeat_info:
                 LOGGER.debug("Found valid repeat pattern: %s -> %s", repeat_string, repeat_info)
                 # Calculate due date from TODAY, not from any text in the task
-                today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+                today = start_of_today()
                 calculated_due_date = calculate_first_occurrence(today, repeat_info)
                 if calculated_due_date:
                     LOGGER.debug("Calculated due date from repeat pattern: %s", calculated_due_date.strftime('%Y-%m-%d'))
@@ -1364,16 +1762,12 @@ async def process_new_todo_item(hass: HomeAssistant, entity_id: str, settings: d
                     LOGGER.error("Could not calculate due date for repeat pattern: %s", repeat_string)
             else:
                 LOGGER.debug("Invalid repeat pattern: %s", repeat_string)
-            current_element -= 1
         
         # Check for time component (this is still relevant even with repeat patterns)
-        if len(summary_split) >= abs(current_element):
-            due_time = check_time_format(summary_split[current_element])
-            if due_time:
-                time_string = summary_split[current_element]
-                if len(summary_split) >= abs(current_element - 1) and summary_split[current_element - 1] in ("at", "@"):
-                    current_element -= 1
-                current_element -= 1
+        if tail and check_time_format(tail[-1]):
+            time_string = tail.pop()
+            if tail and tail[-1] in ("at", "@"):
+                tail.pop()
 
         # If we have a repeat pattern, ignore any manual dates and use calculated date
         if repeat_info and calculated_due_date:
@@ -1384,30 +1778,28 @@ async def process_new_todo_item(hass: HomeAssistant, entity_id: str, settings: d
                 time_string = "23:59"
             
             # Remove all date/time text from summary, keep only task name and repeat pattern
-            task_words = []
-            for word in summary_split:
-                # Skip words that look like dates, times, or prefixes, but keep repeat pattern
-                if word == repeat_string:
-                    continue  # We'll add this back at the end
-                elif word in ("at", "@", "in", ":"):
-                    continue
-                elif check_date_format(word) or check_time_format(word):
-                    continue
-                elif re.match(r'^\d+\s*(days?|weeks?|months?|years?|[dwmy])$', word.lower()):
-                    continue
-                else:
-                    task_words.append(word)
+            # (added back at the end); cheap checks run before the date/time parsers
+            task_words = [
+                word for word in summary_split
+                if word != repeat_string
+                and word not in DATE_PREFIX_WORDS
+                and not DURATION_PATTERN.match(word)
+                and not check_date_format(word)
+                and not check_time_format(word)
+            ]
             
-            # Check for multi-word date patterns and remove them
+            # Check for multi-word date patterns and remove them in one forward pass
+            remaining_words = []
             i = 0
-            while i < len(task_words) - 1:
-                two_words = f"{task_words[i]} {task_words[i+1]}"
-                if check_date_format(two_words):
-                    # Remove both words
-                    task_words.pop(i)
-                    task_words.pop(i)  # pop again since list shifted
+            word_count = len(task_words)
+            while i < word_count:
+                if i + 1 < word_count and check_date_format(f"{task_words[i]} {task_words[i+1]}"):
+                    # Skip both words
+                    i += 2
                 else:
+                    remaining_words.append(task_words[i])
                     i += 1
+            task_words = remaining_words
             
             new_summary = f'{" ".join(task_words)} {repeat_string}'.strip()
             
@@ -1416,15 +1808,15 @@ async def process_new_todo_item(hass: HomeAssistant, entity_id: str, settings: d
             date_string = None
             date_words_used = 1
             
-            if len(summary_split) >= abs(current_element):
+            if tail:
                 # First try single word
-                date_obj = check_date_format(summary_split[current_element])
+                date_obj = check_date_format(tail[-1])
                 if date_obj:
                     date_string = f'{date_obj.year}-{date_obj.month:02d}-{date_obj.day:02d}'
                 
                 # If single word didn't work, try two-word combinations
-                if not date_string and len(summary_split) >= abs(current_element - 1):
-                    two_words = f"{summary_split[current_element - 1]} {summary_split[current_element]}"
+                if not date_string and len(tail) >= 2:
+                    two_words = f"{tail[-2]} {tail[-1]}"
                     date_obj = check_date_format(two_words)
                     if date_obj:
                         date_string = f'{date_obj.year}-{date_obj.month:02d}-{date_obj.day:02d}'
@@ -1434,8 +1826,8 @@ async def process_new_todo_item(hass: HomeAssistant, entity_id: str, settings: d
                 LOGGER.debug("Found date in new item: %s", date_string)
                 if not time_string:
                     time_string = "23:59"
-                date_index = current_element - (date_words_used - 1)
-                new_summary = f'{" ".join(summary_split[:date_index])} {repeat_string}'.strip()
+                del tail[-date_words_used:]
+                new_summary = f'{" ".join(tail)} {repeat_string}'.strip()
             else:
                 LOGGER.debug("No date pattern found in new item: %s", summary)
                 return
@@ -1463,6 +1855,7 @@ async def process_new_todo_item(hass: HomeAssistant, entity_id: str, settings: d
                 update_item_dict,
                 blocking=True
             )
+            invalidate_items_cache(entity_id)
             
             # Log repeat info for debugging
             if repeat_info and settings.get("process_recurring", False):
@@ -1482,8 +1875,8 @@ async def process_new_todo_item(hass: HomeAssistant, entity_id: str, settings: d
     except Exception as err:
         LOGGER.error("Error processing new todo item: %s", err)
     finally:
-        # Always remove the processing lock
-        PROCESSING_LOCKS.discard(entity_id)
+        # Always release the processing lock
+        lock.release()
 
 
 async def process_smart_list_task_completion(hass: HomeAssistant, entity_id: str, smart_config: dict[str, Any]) -> None:
@@ -1493,13 +1886,7 @@ async def process_smart_list_task_completion(hass: HomeAssistant, entity_id: str
     
     try:
         # Get all items including completed ones
-        result = await hass.services.async_call(
-            TODO_DOMAIN,
-            "get_items",
-            {"entity_id": entity_id},
-            blocking=True,
-            return_response=True
-        )
+        result = await get_items_cached(hass, entity_id)
         
         if not result or entity_id not in result or "items" not in result[entity_id]:
             return
@@ -1530,20 +1917,29 @@ async def cleanup_completed_tasks_for_smart_list(hass: HomeAssistant, entity_id:
         list_type: 'daily', 'weekly', or 'monthly'
     """
     try:
-        result = await hass.services.async_call(
-            TODO_DOMAIN,
-            "get_items",
-            {"entity_id": entity_id},
-            blocking=True,
-            return_response=True
-        )
+        result = await get_items_cached(hass, entity_id)
         
         if not result or entity_id not in result or "items" not in result[entity_id]:
             return
         
         items = result[entity_id]["items"]
-        now = datetime.now()
-        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        today = start_of_today()
+        
+        # Completed tasks due before the start of the list's current period are removed,
+        # but overdue tasks are kept; the cutoff is the same for every item
+        if list_type == "daily":
+            # Daily: remove completed tasks that are not from today
+            cutoff = today
+        elif list_type == "weekly":
+            # Weekly: remove completed tasks from previous weeks
+            cutoff = get_week_bounds(today.toordinal())[0]
+        elif list_type == "monthly":
+            # Monthly: remove completed tasks from previous months
+            cutoff = today.replace(day=1)
+        else:
+            return
+        cutoff_str = cutoff.date().isoformat()
+        cutoff_ordinal = cutoff.toordinal()
         
         for item in items:
             if item.get("status") != "completed":
@@ -1556,43 +1952,26 @@ async def cleanup_completed_tasks_for_smart_list(hass: HomeAssistant, entity_id:
                 continue
             
             try:
-                # Parse due date
-                if "T" in due_date_str:
-                    due_date = datetime.fromisoformat(due_date_str.replace("Z", "+00:00"))
-                    due_date = due_date.replace(tzinfo=None)
+                if ISO_DAY_PATTERN.match(due_date_str):
+                    # Due dates and datetimes start with their local 'YYYY-MM-DD' date,
+                    # and ISO dates order the same as strings, so no parsing is needed
+                    is_before_cutoff = due_date_str[:10] < cutoff_str
                 else:
-                    due_date = datetime.strptime(due_date_str, "%Y-%m-%d")
+                    # Parse due date and compare whole days as ordinals
+                    is_before_cutoff = parse_due_date(due_date_str).toordinal() < cutoff_ordinal
                 
-                due_date_only = due_date.replace(hour=0, minute=0, second=0, microsecond=0)
-                should_remove = False
-                
-                # Determine if task should be removed based on list type and overdue status
-                if list_type == "daily":
-                    # Daily: remove completed tasks that are not from today, but keep overdue tasks
-                    if due_date_only < today and item.get("status") == "completed":
-                        should_remove = True
-                elif list_type == "weekly":
-                    # Weekly: remove completed tasks from previous weeks, but keep overdue tasks
-                    days_since_sunday = (today.weekday() + 1) % 7
-                    week_start = today - timedelta(days=days_since_sunday)
-                    if due_date_only < week_start and item.get("status") == "completed":
-                        should_remove = True
-                elif list_type == "monthly":
-                    # Monthly: remove completed tasks from previous months, but keep overdue tasks
-                    month_start = today.replace(day=1)
-                    if due_date_only < month_start and item.get("status") == "completed":
-                        should_remove = True
-                
-                if should_remove:
+                if is_before_cutoff:
+                    # Remove by uid so a task sharing this summary isn't removed instead
                     await hass.services.async_call(
                         TODO_DOMAIN,
                         "remove_item",
                         {
                             "entity_id": entity_id,
-                            "item": summary
+                            "item": item.get("uid") or summary
                         },
                         blocking=True
                     )
+                    invalidate_items_cache(entity_id)
                     LOGGER.info("Auto-cleared completed task from %s smart list: %s", list_type, summary)
                     
             except Exception as item_err:
@@ -1612,61 +1991,108 @@ async def schedule_smart_list_cleanup(hass: HomeAssistant, smart_config: dict[st
     weekly_list = smart_config.get(CONF_WEEKLY_LIST, "")
     monthly_list = smart_config.get(CONF_MONTHLY_LIST, "")
     
-    if daily_list:
-        await cleanup_completed_tasks_for_smart_list(hass, daily_list, "daily")
+    # The same entity may be configured for more than one list type; group the
+    # types per entity so each entity's cleanups run one after another
+    list_types_by_entity: dict[str, list[str]] = {}
+    for smart_list, list_type in ((daily_list, "daily"), (weekly_list, "weekly"), (monthly_list, "monthly")):
+        if smart_list:
+            list_types_by_entity.setdefault(smart_list, []).append(list_type)
     
-    if weekly_list:
-        await cleanup_completed_tasks_for_smart_list(hass, weekly_list, "weekly")
+    async def cleanup_entity(smart_list: str, list_types: list[str]) -> None:
+        for list_type in list_types:
+            await cleanup_completed_tasks_for_smart_list(hass, smart_list, list_type)
     
-    if monthly_list:
-        await cleanup_completed_tasks_for_smart_list(hass, monthly_list, "monthly")
+    # Different entities don't share items, so clean them up concurrently
+    await asyncio.gather(*(
+        cleanup_entity(smart_list, list_types)
+        for smart_list, list_types in list_types_by_entity.items()
+    ))
 
 
-def schedule_next_cleanup(hass: HomeAssistant, smart_config: dict[str, Any]) -> None:
-    """Schedule the next cleanup at the appropriate time."""
+def schedule_next_cleanup(hass: HomeAssistant, entry: ConfigEntry, smart_config: dict[str, Any]) -> None:
+    """Schedule daily smart list cleanups at midnight.
+    
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry the scheduler belongs to
+        smart_config: Smart list settings
+    """
     if not smart_config.get(CONF_ENABLE_SMART_LISTS, False):
         return
     
-    now = datetime.now()
-    
-    # Calculate next cleanup time (every day at midnight)
-    next_cleanup = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-    delay_seconds = (next_cleanup - now).total_seconds()
-    
-    LOGGER.debug("Scheduling next smart list cleanup in %d seconds", delay_seconds)
+    LOGGER.debug("Setting up smart list cleanup midnight scheduler")
     
-    def cleanup_callback():
-        """Callback to run cleanup and schedule next one."""
-        hass.async_create_background_task(
+    @callback
+    def cleanup_callback(now: datetime) -> None:
+        """Callback to run smart list cleanup."""
+        create_background_task(
+            hass,
             schedule_smart_list_cleanup(hass, smart_config),
             name="todo_magic_smart_list_cleanup"
         )
-        # Schedule the next cleanup
-        schedule_next_cleanup(hass, smart_config)
     
-    hass.loop.call_later(delay_seconds, cleanup_callback)
+    # Schedule daily at midnight (00:00:00)
+    remove_tracker = event_helper.async_track_time_change(
+        hass,
+        cleanup_callback,
+        hour=0,
+        minute=0,
+        second=0
+    )
+    
+    # Clean up tracker when unloading
+    entry.async_on_unload(remove_tracker)
+
+
+@lru_cache(maxsize=256)
+def format_repeat_pattern(repeat_type: str, unit: str, interval: int, days: tuple[str, ...]) -> str:
+    """Rebuild a repeat pattern string like [2w] or [mwf] from parsed repeat info.
+    
+    Args:
+        repeat_type: 'simple' or 'advanced'
+        unit: 'd', 'w', 'm' or 'y'
+        interval: Repeat interval
+        days: Day abbreviations for advanced weekly patterns
+    
+    Returns:
+        The repeat pattern, brackets included
+    """
+    if repeat_type == 'simple':
+        if interval == 1:
+            return f"[{unit}]"
+        return f"[{interval}{unit}]"
+    
+    if repeat_type == 'advanced' and unit == 'w':
+        day_string = ''.join(DAY_CHARS[day] for day in days if day in DAY_CHARS)
+        if interval == 1:
+            # Check if this could be a direct pattern like [mwf] (no w- prefix needed)
+            # Use the shorter form for single intervals
+            return f"[{day_string}]"
+        return f"[{interval}w-{day_string}]"
+    
+    return f"[{unit}]"  # Fallback
 
 
 async def find_duplicate_recurring_task(hass: HomeAssistant, entity_id: str, 
-                                       summary_with_pattern: str) -> dict[str, Any] | None:
+                                       summary_with_pattern: str,
+                                       open_items: dict[str, dict[str, Any]] | None = None) -> dict[str, Any] | None:
     """Find existing task with the same summary and repeat pattern.
     
     Args:
         hass: Home Assistant instance
         entity_id: Todo entity ID
         summary_with_pattern: Task summary including repeat pattern
+        open_items: Optional index of the list's open items by summary, as
+            already fetched by the caller; avoids another get_items call
     
     Returns:
         Existing task dict if found, None otherwise
     """
+    if open_items is not None:
+        return open_items.get(summary_with_pattern)
+    
     try:
-        result = await hass.services.async_call(
-            TODO_DOMAIN,
-            "get_items",
-            {"entity_id": entity_id},
-            blocking=True,
-            return_response=True
-        )
+        result = await get_items_cached(hass, entity_id)
         
         if not result or entity_id not in result or "items" not in result[entity_id]:
             return None
@@ -1686,7 +2112,8 @@ async def find_duplicate_recurring_task(hass: HomeAssistant, entity_id: str,
 
 async def create_recurring_task(hass: HomeAssistant, entity_id: str, original_summary: str, 
                                repeat_info: dict[str, Any], original_due_date: datetime,
-                               time_string: str = "") -> None:
+                               time_string: str = "",
+                               open_items: dict[str, dict[str, Any]] | None = None) -> None:
     """Create a new instance of a recurring task.
     
     Args:
@@ -1696,10 +2123,12 @@ async def create_recurring_task(hass: HomeAssistant, entity_id: str, original_su
         repeat_info: Repeat pattern information
         original_due_date: Original due date
         time_string: Time component if present
+        open_items: Optional index of the list's open items by summary; kept
+            up to date with the task created or updated here
     """
     try:
         # Calculate next occurrence using completion date and original due date for proper timing logic
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        today = start_of_today()
         next_date = schedule_next_occurrence(today, original_due_date, repeat_info)
         if not next_date:
             LOGGER.error("Could not calculate next occurrence for recurring task: %s", original_summary)
@@ -1709,43 +2138,24 @@ async def create_recurring_task(hass: HomeAssistant, entity_id: str, original_su
                     today.strftime('%Y-%m-%d'), original_due_date.strftime('%Y-%m-%d'), next_date.strftime('%Y-%m-%d %H:%M'))
         
         # Reconstruct the repeat pattern string
-        unit = repeat_info['unit']
-        interval = repeat_info.get('interval', 1)
-        
-        if repeat_info['type'] == 'simple':
-            if interval == 1:
-                repeat_pattern = f"[{unit}]"
-            else:
-                repeat_pattern = f"[{interval}{unit}]"
-        elif repeat_info['type'] == 'advanced' and unit == 'w':
-            days = repeat_info.get('days', [])
-            day_chars = {
-                'mon': 'm', 'tue': 't', 'wed': 'w', 'thu': 'r',
-                'fri': 'f', 'sat': 's', 'sun': 'u'
-            }
-            day_string = ''.join(day_chars.get(day, '') for day in days)
-            if interval == 1:
-                # Check if this could be a direct pattern like [mwf] (no w- prefix needed)
-                # Use the shorter form for single intervals
-                repeat_pattern = f"[{day_string}]"
-            else:
-                repeat_pattern = f"[{interval}w-{day_string}]"
-        else:
-            repeat_pattern = f"[{unit}]"  # Fallback
+        repeat_pattern = format_repeat_pattern(
+            repeat_info['type'], repeat_info['unit'], repeat_info.get('interval', 1),
+            tuple(repeat_info.get('days', ()))
+        )
         
         # Create new task summary with repeat pattern
         new_summary = f"{original_summary} {repeat_pattern}".strip()
         
         # Check for duplicate tasks before creating
-        existing_task = await find_duplicate_recurring_task(hass, entity_id, new_summary)
+        existing_task = await find_duplicate_recurring_task(hass, entity_id, new_summary, open_items)
         
         # Format next due date
-        next_date_str = f'{next_date.year}-{next_date.month:02d}-{next_date.day:02d}'
+        next_date_str = next_date.date().isoformat()
+        new_due_datetime = f"{next_date_str} {time_string}" if time_string else next_date_str
         
         if existing_task:
             # Task already exists, check if due dates differ
             existing_due = existing_task.get("due", "")
-            new_due_datetime = f"{next_date_str} {time_string}" if time_string else next_date_str
             
             if existing_due != new_due_datetime:
                 # Due dates differ, update the existing task with new due date
@@ -1759,7 +2169,7 @@ async def create_recurring_task(hass: HomeAssistant, entity_id: str, original_su
                 }
                 
                 if time_string:
-                    update_item_dict["due_datetime"] = f"{next_date_str} {time_string}"
+                    update_item_dict["due_datetime"] = new_due_datetime
                 else:
                     update_item_dict["due_date"] = next_date_str
                 
@@ -1769,6 +2179,9 @@ async def create_recurring_task(hass: HomeAssistant, entity_id: str, original_su
                     update_item_dict,
                     blocking=True
                 )
+                invalidate_items_cache(entity_id)
+                if open_items is not None:
+                    open_items[new_summary] = {**existing_task, "due": new_due_datetime}
                 
                 LOGGER.info("Updated recurring task due date: %s", new_summary)
             else:
@@ -1787,7 +2200,7 @@ async def create_recurring_task(hass: HomeAssistant, entity_id: str, original_su
             }
             
             if time_string:
-                add_item_dict["due_datetime"] = f"{next_date_str} {time_string}"
+                add_item_dict["due_datetime"] = new_due_datetime
             else:
                 add_item_dict["due_date"] = next_date_str
             
@@ -1799,21 +2212,14 @@ async def create_recurring_task(hass: HomeAssistant, entity_id: str, original_su
                 add_item_dict,
                 blocking=True
             )
-            
-            # Clean up the tracking after a short delay to prevent permanent accumulation
-            # The task should be processed and have its due date set by then
-            import asyncio
-            def cleanup_tracking():
-                NEWLY_CREATED_RECURRING_TASKS.discard(task_key)
-            
-            # Schedule cleanup in 5 seconds
-            hass.loop.call_later(5, cleanup_tracking)
+            invalidate_items_cache(entity_id)
+            if open_items is not None:
+                open_items[new_summary] = {"summary": new_summary, "status": "needs_action", "due": new_due_datetime}
             
             LOGGER.info("Created recurring task: %s", new_summary)
         
         # Apply auto-sort after creating recurring task
         # Need to get settings for this entity
-        from homeassistant.config_entries import ConfigEntry
         # Note: We need access to the config entry to get settings, but it's not passed to this function
         # For now, we'll skip auto-sort in recurring task creation and rely on state change listener
         
@@ -1828,24 +2234,28 @@ async def check_for_completed_recurring_tasks(hass: HomeAssistant, entity_id: st
     
     try:
         # Get all items including completed ones
-        result = await hass.services.async_call(
-            TODO_DOMAIN,
-            "get_items",
-            {"entity_id": entity_id},
-            blocking=True,
-            return_response=True
-        )
+        result = await get_items_cached(hass, entity_id)
         
         if not result or entity_id not in result or "items" not in result[entity_id]:
             return
         
         items = result[entity_id]["items"]
         
+        # Split out completed items in one pass, indexing open items by summary
+        # so duplicate checks don't refetch the list
+        completed_items = []
+        open_items: dict[str, dict[str, Any]] = {}
         for item in items:
-            # Look for completed items with repeat patterns
-            if item.get("status") != "completed":
-                continue
-            
+            if item.get("status") == "completed":
+                completed_items.append(item)
+            elif "summary" in item:
+                open_items.setdefault(item["summary"], item)
+        
+        if not completed_items:
+            return
+        
+        # Look for completed items with repeat patterns
+        for item in completed_items:
             summary = item.get("summary", "")
             if not summary:
                 continue
@@ -1862,10 +2272,11 @@ async def check_for_completed_recurring_tasks(hass: HomeAssistant, entity_id: st
             if task_key in PROCESSED_COMPLETED_ITEMS:
                 continue
             
-            # Check if this item has a repeat pattern
-            words = summary.split()
-            if not words:
+            # Check if this item has a repeat pattern; most completed items have no
+            # bracket at all, so skip those before splitting the summary into words
+            if "[" not in summary:
                 continue
+            words = summary.split()
             
             # Look for repeat pattern in the summary
             repeat_pattern = None
@@ -1893,8 +2304,8 @@ async def check_for_completed_recurring_tasks(hass: HomeAssistant, entity_id: st
             
             try:
                 if "T" in due_date_str:
-                    # Due datetime format
-                    original_due_date = datetime.fromisoformat(due_date_str.replace("Z", "+00:00"))
+                    # Due datetime format (fromisoformat accepts a trailing 'Z' on Python 3.11+)
+                    original_due_date = datetime.fromisoformat(due_date_str)
                     time_string = original_due_date.strftime("%H:%M")
                     # Convert to naive datetime for comparison (remove timezone info)
                     original_due_date = original_due_date.replace(tzinfo=None)
@@ -1914,7 +2325,7 @@ async def check_for_completed_recurring_tasks(hass: HomeAssistant, entity_id: st
             # Create new recurring instance
             await create_recurring_task(
                 hass, entity_id, original_summary, repeat_info, 
-                original_due_date, time_string
+                original_due_date, time_string, open_items
             )
             
             # Remove the repeat pattern from the completed task to prevent re-processing
@@ -1930,6 +2341,7 @@ async def check_for_completed_recurring_tasks(hass: HomeAssistant, entity_id: st
                     },
                     blocking=True
                 )
+                invalidate_items_cache(entity_id)
                 LOGGER.debug("Cleaned up completed recurring task: %s", original_summary)
             except Exception as cleanup_err:
                 LOGGER.error("Error cleaning up completed recurring task: %s", cleanup_err)
@@ -1938,12 +2350,13 @@ async def check_for_completed_recurring_tasks(hass: HomeAssistant, entity_id: st
         LOGGER.error("Error checking for completed recurring tasks: %s", err)
 
 
-def should_clear_completed_task(item: dict[str, Any], clear_days: int) -> bool:
+def should_clear_completed_task(item: dict[str, Any], clear_days: int, today: datetime | None = None) -> bool:
     """Determine if a completed task should be cleared based on age.
     
     Args:
         item: Task item dictionary
         clear_days: Number of days to keep completed tasks (-1 = disabled, 0+ = enabled)
+        today: Today at midnight; pass it in when checking many tasks at once
     
     Returns:
         True if task should be cleared, False otherwise
@@ -1973,14 +2386,11 @@ def should_clear_completed_task(item: dict[str, Any], clear_days: int) -> bool:
     
     try:
         # Parse the due date
-        if "T" in due_date_str:
-            task_date = datetime.fromisoformat(due_date_str.replace("Z", "+00:00"))
-            task_date = task_date.replace(tzinfo=None)
-        else:
-            task_date = datetime.strptime(due_date_str, "%Y-%m-%d")
+        task_date = parse_due_date(due_date_str)
         
         task_date_only = task_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        if today is None:
+            today = start_of_today()
         
         # Calculate age in days
         age_days = (today - task_date_only).days
@@ -2008,13 +2418,7 @@ async def clear_completed_tasks_if_enabled(hass: HomeAssistant, entity_id: str,
     
     try:
         # Get all items from the todo list
-        result = await hass.services.async_call(
-            TODO_DOMAIN,
-            "get_items",
-            {"entity_id": entity_id},
-            blocking=True,
-            return_response=True
-        )
+        result = await get_items_cached(hass, entity_id)
         
         if not result or entity_id not in result or "items" not in result[entity_id]:
             LOGGER.debug("No items found for auto-clear: %s", entity_id)
@@ -2024,10 +2428,11 @@ async def clear_completed_tasks_if_enabled(hass: HomeAssistant, entity_id: str,
         
         # Find completed tasks that should be cleared
         tasks_to_clear = []
+        today = start_of_today()
         for item in items:
             LOGGER.debug("Checking item for clearing: %s, status=%s, due=%s", 
                         item.get("summary"), item.get("status"), item.get("due"))
-            should_clear = should_clear_completed_task(item, clear_days)
+            should_clear = should_clear_completed_task(item, clear_days, today)
             LOGGER.debug("Should clear result: %s", should_clear)
             if should_clear:
                 tasks_to_clear.append(item)
@@ -2039,109 +2444,62 @@ async def clear_completed_tasks_if_enabled(hass: HomeAssistant, entity_id: str,
         
         LOGGER.debug("Found %d completed tasks to clear for %s", len(tasks_to_clear), entity_id)
         
-        # First try bulk removal using remove_completed_items service
-        try:
-            await hass.services.async_call(
-                TODO_DOMAIN,
-                "remove_completed_items",
-                {"entity_id": entity_id},
-                blocking=True
-            )
-            
-            # Check if this cleared all the tasks we wanted to clear
-            # Note: This service removes ALL completed items, not just old ones
-            # So we need to re-add any completed items that shouldn't be cleared yet
-            
-            # Get remaining items after bulk clear
-            result_after = await hass.services.async_call(
-                TODO_DOMAIN,
-                "get_items",
-                {"entity_id": entity_id},
-                blocking=True,
-                return_response=True
+        async def remove_individually() -> None:
+            """Remove just the tasks due for clearing, all dispatched at once."""
+            # Removing by uid keeps concurrent removals of tasks with the same summary
+            # from targeting the same item
+            tasks_with_summary = [item for item in tasks_to_clear if item.get("summary", "")]
+            results = await asyncio.gather(
+                *(hass.services.async_call(
+                    TODO_DOMAIN,
+                    "remove_item",
+                    {
+                        "entity_id": entity_id,
+                        "item": item.get("uid") or item["summary"]
+                    },
+                    blocking=True
+                ) for item in tasks_with_summary),
+                return_exceptions=True
             )
             
-            if result_after and entity_id in result_after and "items" in result_after[entity_id]:
-                remaining_items = result_after[entity_id]["items"]
-                
-                # Find completed tasks that were cleared but shouldn't have been
-                for item in items:
-                    if (item.get("status") == "completed" and 
-                        not should_clear_completed_task(item, clear_days) and
-                        not any(remaining.get("summary") == item.get("summary") and 
-                               remaining.get("due") == item.get("due") 
-                               for remaining in remaining_items)):
-                        
-                        # Re-add the task that was cleared but shouldn't have been
-                        try:
-                            add_item_dict = {
-                                "entity_id": entity_id,
-                                "item": item.get("summary", ""),
-                            }
-                            
-                            due_date_str = item.get("due", "")
-                            if due_date_str:
-                                if "T" in due_date_str:
-                                    add_item_dict["due_datetime"] = due_date_str
-                                else:
-                                    add_item_dict["due_date"] = due_date_str
-                            
-                            await hass.services.async_call(
-                                TODO_DOMAIN,
-                                "add_item",
-                                add_item_dict,
-                                blocking=True
-                            )
-                            
-                            # Mark it as completed again
-                            await hass.services.async_call(
-                                TODO_DOMAIN,
-                                "update_item",
-                                {
-                                    "entity_id": entity_id,
-                                    "item": item.get("summary", ""),
-                                    "status": "completed"
-                                },
-                                blocking=True
-                            )
-                            
-                            LOGGER.debug("Re-added completed task that shouldn't have been cleared: %s", 
-                                       item.get("summary"))
-                            
-                        except Exception as readd_err:
-                            LOGGER.error("Error re-adding completed task: %s", readd_err)
-            
-            LOGGER.info("Auto-cleared completed tasks for %s using bulk removal", entity_id)
-            
-        except Exception as bulk_err:
-            LOGGER.debug("Bulk removal failed for %s, trying individual removal: %s", entity_id, bulk_err)
-            
-            # Fall back to individual item removal
             cleared_count = 0
-            for item in tasks_to_clear:
-                summary = item.get("summary", "")
-                if not summary:
-                    continue
-                
-                try:
-                    await hass.services.async_call(
-                        TODO_DOMAIN,
-                        "remove_item",
-                        {
-                            "entity_id": entity_id,
-                            "item": summary
-                        },
-                        blocking=True
-                    )
+            for item, item_result in zip(tasks_with_summary, results):
+                summary = item["summary"]
+                if isinstance(item_result, BaseException):
+                    LOGGER.warning("Could not clear completed task '%s': %s", summary, item_result)
+                else:
                     cleared_count += 1
                     LOGGER.debug("Cleared completed task: %s", summary)
-                    
-                except Exception as item_err:
-                    LOGGER.warning("Could not clear completed task '%s': %s", summary, item_err)
             
             if cleared_count > 0:
                 LOGGER.info("Auto-cleared %d completed tasks for %s using individual removal", 
                            cleared_count, entity_id)
+        
+        # remove_completed_items removes ALL completed items, so it's only usable when every
+        # completed item is due for clearing; otherwise remove just the ones that are, rather
+        # than bulk clearing and re-adding the rest
+        cleared_ids = {id(item) for item in tasks_to_clear}
+        keeps_completed = any(
+            item.get("status") == "completed" and id(item) not in cleared_ids for item in items
+        )
+        
+        if keeps_completed:
+            await remove_individually()
+        else:
+            try:
+                await hass.services.async_call(
+                    TODO_DOMAIN,
+                    "remove_completed_items",
+                    {"entity_id": entity_id},
+                    blocking=True
+                )
+                LOGGER.info("Auto-cleared completed tasks for %s using bulk removal", entity_id)
+                
+            except Exception as bulk_err:
+                LOGGER.debug("Bulk removal failed for %s, trying individual removal: %s", entity_id, bulk_err)
+                await remove_individually()
+        
+        invalidate_items_cache(entity_id)
     
     except Exception as err:
         LOGGER.error("Error during auto-clear for %s: %s", entity_id, err)
@@ -2159,14 +2517,14 @@ async def run_smart_list_reflection_check(hass: HomeAssistant, entry: ConfigEntr
     """
     LOGGER.debug("Running smart list reflection check")
     
-    smart_config = get_smart_list_settings(entry.options)
+    smart_config = get_smart_list_settings(entry.options, entry.entry_id)
     if not smart_config.get(CONF_ENABLE_SMART_LISTS, False):
         LOGGER.debug("Smart lists disabled, skipping reflection check")
         return
     
     # Get all todo entities
     todo_entity_ids = [eid for eid in hass.states.async_entity_ids(TODO_DOMAIN)
-                      if hass.states.get(eid) and hass.states.get(eid).state != "unavailable"]
+                      if (state := hass.states.get(eid)) and state.state != "unavailable"]
     
     if not todo_entity_ids:
         LOGGER.debug("No todo entities found for smart list reflection check")
@@ -2215,12 +2573,14 @@ async def run_smart_list_reflection_check(hass: HomeAssistant, entry: ConfigEntr
                                 blocking=True
                             )
                 
+                invalidate_items_cache(smart_list)
                 LOGGER.debug("Cleared smart list for reflection: %s", smart_list)
                 
             except Exception as clear_err:
                 LOGGER.error("Error clearing smart list %s: %s", smart_list, clear_err)
     
     reflected_tasks = 0
+    today = start_of_today()
     
     # Step 2: Scan all non-smart lists and reflect tasks into appropriate smart lists
     for entity_id in todo_entity_ids:
@@ -2230,13 +2590,7 @@ async def run_smart_list_reflection_check(hass: HomeAssistant, entry: ConfigEntr
             
         try:
             # Get all items from this source list
-            result = await hass.services.async_call(
-                TODO_DOMAIN,
-                "get_items",
-                {"entity_id": entity_id},
-                blocking=True,
-                return_response=True
-            )
+            result = await get_items_cached(hass, entity_id)
             
             if not result or entity_id not in result or "items" not in result[entity_id]:
                 continue
@@ -2253,14 +2607,10 @@ async def run_smart_list_reflection_check(hass: HomeAssistant, entry: ConfigEntr
                 
                 try:
                     # Parse due date
-                    if "T" in due_date_str:
-                        due_date = datetime.fromisoformat(due_date_str.replace("Z", "+00:00"))
-                        due_date = due_date.replace(tzinfo=None)
-                    else:
-                        due_date = datetime.strptime(due_date_str, "%Y-%m-%d")
+                    due_date = parse_due_date(due_date_str)
                     
                     # Determine which smart lists should reflect this task
-                    timeframe = analyze_task_timeframe(due_date)
+                    timeframe = analyze_task_timeframe(due_date, today)
                     target_smart_lists = []
                     
                     # A task can appear in multiple smart lists
@@ -2297,6 +2647,7 @@ async def run_smart_list_reflection_check(hass: HomeAssistant, entry: ConfigEntr
                                 add_item_dict,
                                 blocking=True
                             )
+                            invalidate_items_cache(target_list)
                             
                             reflected_tasks += 1
                             LOGGER.debug("Reflected task from %s to %s: %s", 
@@ -2325,7 +2676,7 @@ async def run_auto_clear_check(hass: HomeAssistant, entry: ConfigEntry) -> None:
     
     # Get all todo entities
     todo_entity_ids = [eid for eid in hass.states.async_entity_ids(TODO_DOMAIN)
-                      if hass.states.get(eid) and hass.states.get(eid).state != "unavailable"]
+                      if (state := hass.states.get(eid)) and state.state != "unavailable"]
     
     if not todo_entity_ids:
         LOGGER.debug("No todo entities found for auto-clear check")
@@ -2333,15 +2684,26 @@ async def run_auto_clear_check(hass: HomeAssistant, entry: ConfigEntry) -> None:
     
     # Check each entity for auto-clear settings
     cleared_entities = []
+    semaphore = asyncio.Semaphore(AUTO_CLEAR_MAX_CONCURRENT_ENTITIES)
+    
+    async def clear_entity(entity_id: str, settings: dict[str, Any]) -> None:
+        async with semaphore:
+            await clear_completed_tasks_if_enabled(hass, entity_id, settings)
+    
+    clears = []
     for entity_id in todo_entity_ids:
-        settings = get_entity_settings(entry.options, entity_id)
+        settings = get_entity_settings(entry.options, entity_id, entry.entry_id)
         clear_days = settings.get("clear_days", -1)
         
         if clear_days >= 0:
             # Auto-clear is enabled for this entity
-            await clear_completed_tasks_if_enabled(hass, entity_id, settings)
+            clears.append(clear_entity(entity_id, settings))
             cleared_entities.append(entity_id)
     
+    # Entities are cleared independently; the semaphore keeps the number of
+    # lists being worked on at once small enough not to flood the service bus
+    await asyncio.gather(*clears)
+    
     if cleared_entities:
         LOGGER.info("Completed auto-clear check for %d entities: %s", 
                    len(cleared_entities), cleared_entities)
@@ -2362,7 +2724,8 @@ def schedule_smart_list_reflection_check(hass: HomeAssistant, entry: ConfigEntry
     def smart_list_reflection_callback(now: datetime) -> None:
         """Callback to run smart list reflection check."""
         LOGGER.debug("Smart list reflection midnight trigger fired")
-        hass.async_create_background_task(
+        create_background_task(
+            hass,
             run_smart_list_reflection_check(hass, entry),
             name="todo_magic_smart_list_reflection_check"
         )
@@ -2395,7 +2758,8 @@ def schedule_auto_clear_check(hass: HomeAssistant, entry: ConfigEntry) -> None:
     def auto_clear_callback(now: datetime) -> None:
         """Callback to run auto-clear check."""
         LOGGER.debug("Auto-clear midnight trigger fired")
-        hass.async_create_background_task(
+        create_background_task(
+            hass,
             run_auto_clear_check(hass, entry),
             name="todo_magic_auto_clear_check"
         )
@@ -2428,12 +2792,18 @@ async def async_setup_entry(
     LOGGER.debug("Registering state change listener")
     remove_listener = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
-        partial(state_changed_listener, hass, entry)
+        partial(state_changed_listener, hass, entry),
+        event_filter=todo_state_event_filter,
     )
 
     # Make sure to clean up the listener when unloading
     entry.async_on_unload(remove_listener)
 
+    # Cached todo entity objects go stale when their registry entries change
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, entity_registry_updated_listener)
+    )
+
     # Register update listener for options changes
     entry.add_update_listener(options_update_listener)
 
@@ -2462,7 +2832,7 @@ async def async_setup_entry(
     smart_config = get_smart_list_settings(entry.options)
     if smart_config.get(CONF_ENABLE_SMART_LISTS, False):
         LOGGER.debug("Initializing smart list cleanup scheduler")
-        schedule_next_cleanup(hass, smart_config)
+        schedule_next_cleanup(hass, entry, smart_config)
         
         # Initialize smart list reflection scheduler
         LOGGER.debug("Initializing smart list reflection scheduler")
@@ -2491,5 +2861,9 @@ async def async_unload_entry(
     entry: ConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    # Unloading is handled by entry.async_on_unload
+    # Listeners are removed by entry.async_on_unload; stop any queued entity work
+    cancel_entity_workers()
+    clear_entity_settings_cache(entry.entry_id)
+    TODO_ENTITY_CACHE.clear()
+    SORTED_ORDER_HASHES.clear()
     return True
@@ -23,6 +23,25 @@ from .const import (
 
 LOGGER = logging.getLogger(__name__)
 
+# Per-entity option key suffixes and the entity list selection each one feeds
+ENTITY_OPTION_SELECTIONS = (
+    ("_auto_due_parsing", "auto_due_parsing_entities"),
+    ("_auto_sort", "auto_sort_entities"),
+    ("_process_recurring", "process_recurring_entities"),
+    ("_clear_days", "auto_clear_entities"),
+)
+
+# Selectors don't depend on the current options, so forms share these instances
+BOOLEAN_SELECTOR = selector.BooleanSelector()
+TODO_ENTITIES_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=TODO_DOMAIN, multiple=True)
+)
+CLEAR_DAYS_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=-1, max=365, step=1, mode=selector.NumberSelectorMode.BOX
+    )
+)
+
 
 class MagicTodoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for Todo Magic."""
@@ -61,11 +80,15 @@ class MagicTodoOptionsFlowHandler(config_entries.OptionsFlow):
         """Initialize options flow."""
         # self.config_entry = config_entry
         self.user_input = {}
+        # Available todo entities, looked up once per init step and reused by later steps
+        self._valid_todo_entities: list[str] = []
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the main settings form with entity selectors."""
+        self._valid_todo_entities = self._get_valid_todo_entities()
+
         if user_input is not None:
             # Store the user input and check next steps
             self.user_input = user_input
@@ -86,12 +109,7 @@ class MagicTodoOptionsFlowHandler(config_entries.OptionsFlow):
                 return self.async_create_entry(title="", data=converted_options)
 
         # Check if we have todo entities
-        todo_entity_ids = [
-            eid
-            for eid in self.hass.states.async_entity_ids(TODO_DOMAIN)
-            if self.hass.states.get(eid)
-            and self.hass.states.get(eid).state != "unavailable"
-        ]
+        todo_entity_ids = self._valid_todo_entities
 
         LOGGER.debug("Found todo entities: %s", todo_entity_ids)
 
@@ -118,35 +136,27 @@ class MagicTodoOptionsFlowHandler(config_entries.OptionsFlow):
             vol.Optional(
                 CONF_ENABLE_SMART_LISTS,
                 default=valid_selections.get(CONF_ENABLE_SMART_LISTS, False),
-            ): selector.BooleanSelector(),
+            ): BOOLEAN_SELECTOR,
             # Auto Due Date Parsing
             vol.Optional(
                 "auto_due_parsing_entities",
                 default=valid_selections.get("auto_due_parsing_entities", []),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=TODO_DOMAIN, multiple=True)
-            ),
+            ): TODO_ENTITIES_SELECTOR,
             # Auto Sort
             vol.Optional(
                 "auto_sort_entities",
                 default=valid_selections.get("auto_sort_entities", []),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=TODO_DOMAIN, multiple=True)
-            ),
+            ): TODO_ENTITIES_SELECTOR,
             # Process Recurring Tasks
             vol.Optional(
                 "process_recurring_entities",
                 default=valid_selections.get("process_recurring_entities", []),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=TODO_DOMAIN, multiple=True)
-            ),
+            ): TODO_ENTITIES_SELECTOR,
             # Auto-clear settings
             vol.Optional(
                 "auto_clear_entities",
                 default=valid_selections.get("auto_clear_entities", []),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=TODO_DOMAIN, multiple=True)
-            ),
+            ): TODO_ENTITIES_SELECTOR,
         }
 
         return self.async_show_form(
@@ -196,11 +206,7 @@ class MagicTodoOptionsFlowHandler(config_entries.OptionsFlow):
                         f"{entity_key}_clear_days",
                         default=current_day_settings.get(entity_id, 7),
                     )
-                ] = selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=-1, max=365, step=1, mode=selector.NumberSelectorMode.BOX
-                    )
-                )
+                ] = CLEAR_DAYS_SELECTOR
 
                 # Add description for this entity
                 entity_descriptions[f"{entity_key}_clear_days"] = (
@@ -239,14 +245,13 @@ class MagicTodoOptionsFlowHandler(config_entries.OptionsFlow):
                 return self.async_create_entry(title="", data=converted_options)
 
         # Get available todo entities for smart list selection
-        todo_entity_ids = [
-            eid
-            for eid in self.hass.states.async_entity_ids(TODO_DOMAIN)
-            if self.hass.states.get(eid)
-            and self.hass.states.get(eid).state != "unavailable"
+        todo_states = [
+            state
+            for state in self.hass.states.async_all(TODO_DOMAIN)
+            if state.state != "unavailable"
         ]
 
-        if not todo_entity_ids:
+        if not todo_states:
             # No entities available, skip smart list config
             converted_options = self._convert_selections_to_entity_options(
                 self.user_input
@@ -258,11 +263,9 @@ class MagicTodoOptionsFlowHandler(config_entries.OptionsFlow):
 
         # Create options for entity selectors (including "None" option)
         entity_options = [{"value": "", "label": "None"}]
-        for entity_id in todo_entity_ids:
-            state = self.hass.states.get(entity_id)
-            if state:
-                friendly_name = state.attributes.get("friendly_name", entity_id)
-                entity_options.append({"value": entity_id, "label": friendly_name})
+        for state in todo_states:
+            friendly_name = state.attributes.get("friendly_name", state.entity_id)
+            entity_options.append({"value": state.entity_id, "label": friendly_name})
 
         # Build schema for smart list configuration
         schema_dict = {
@@ -306,9 +309,17 @@ class MagicTodoOptionsFlowHandler(config_entries.OptionsFlow):
         return self.async_show_form(
             step_id="smart_list_config",
             data_schema=vol.Schema(schema_dict),
-            description_placeholders={"entity_count": str(len(todo_entity_ids))},
+            description_placeholders={"entity_count": str(len(todo_states))},
         )
 
+    def _get_valid_todo_entities(self) -> list[str]:
+        """Get the IDs of all todo entities that aren't unavailable."""
+        return [
+            state.entity_id
+            for state in self.hass.states.async_all(TODO_DOMAIN)
+            if state.state != "unavailable"
+        ]
+
     def _get_current_selections_from_options(self) -> dict[str, Any]:
         """Convert current per-entity options back to entity lists."""
         current_options = self.config_entry.options
@@ -323,41 +334,29 @@ class MagicTodoOptionsFlowHandler(config_entries.OptionsFlow):
         }
 
         # Get all actual todo entities to use for validation
-        all_todo_entities = [
-            eid
-            for eid in self.hass.states.async_entity_ids(TODO_DOMAIN)
-            if self.hass.states.get(eid)
-            and self.hass.states.get(eid).state != "unavailable"
-        ]
+        all_todo_entities = self._valid_todo_entities
+
+        # Map option key prefixes back to entity IDs once for all option keys
+        key_to_entity = {}
+        for eid in all_todo_entities:
+            key_to_entity.setdefault(self._entity_id_to_key(eid), eid)
 
         # Convert individual entity settings back to lists
         for key, value in current_options.items():
-            if "_auto_due_parsing" in key and value:
-                entity_id = self._key_to_entity_id(
-                    key.replace("_auto_due_parsing", ""), all_todo_entities
-                )
-                if entity_id:
-                    selections["auto_due_parsing_entities"].append(entity_id)
-            elif "_auto_sort" in key and value:
-                entity_id = self._key_to_entity_id(
-                    key.replace("_auto_sort", ""), all_todo_entities
-                )
-                if entity_id:
-                    selections["auto_sort_entities"].append(entity_id)
-            elif "_process_recurring" in key and value:
-                entity_id = self._key_to_entity_id(
-                    key.replace("_process_recurring", ""), all_todo_entities
-                )
-                if entity_id:
-                    selections["process_recurring_entities"].append(entity_id)
-            elif (
-                "_clear_days" in key and isinstance(value, (int, float)) and value >= 0
-            ):
-                entity_id = self._key_to_entity_id(
-                    key.replace("_clear_days", ""), all_todo_entities
-                )
-                if entity_id:
-                    selections["auto_clear_entities"].append(entity_id)
+            for suffix, selection in ENTITY_OPTION_SELECTIONS:
+                if not key.endswith(suffix):
+                    continue
+                if selection == "auto_clear_entities":
+                    enabled = isinstance(value, (int, float)) and value >= 0
+                else:
+                    enabled = bool(value)
+                if enabled:
+                    entity_id = self._key_to_entity_id(
+                        key[: -len(suffix)], key_to_entity
+                    )
+                    if entity_id:
+                        selections[selection].append(entity_id)
+                break
 
         return selections
 
@@ -378,10 +377,11 @@ class MagicTodoOptionsFlowHandler(config_entries.OptionsFlow):
         self, selections: dict[str, Any], valid_entities: list[str]
     ) -> dict[str, Any]:
         """Filter selections to only include entities that currently exist."""
+        valid_entity_set = set(valid_entities)
         filtered = {}
         for key, entity_list in selections.items():
             if isinstance(entity_list, list):
-                filtered[key] = [eid for eid in entity_list if eid in valid_entities]
+                filtered[key] = [eid for eid in entity_list if eid in valid_entity_set]
             else:
                 filtered[key] = entity_list
         return filtered
@@ -390,17 +390,13 @@ class MagicTodoOptionsFlowHandler(config_entries.OptionsFlow):
         """Convert entity ID to option key."""
         return entity_id.replace(".", "_")
 
-    def _key_to_entity_id(self, key: str, all_entities: list[str]) -> str | None:
-        """Convert option key back to entity ID by matching against known entities."""
-        # Try direct conversion first
-        candidate = key.replace("_", ".")
-        if candidate in all_entities:
-            return candidate
-
-        # If that doesn't work, try to find a matching entity
-        for entity_id in all_entities:
-            if self._entity_id_to_key(entity_id) == key:
-                return entity_id
+    def _key_to_entity_id(
+        self, key: str, key_to_entity: dict[str, str]
+    ) -> str | None:
+        """Convert option key back to entity ID using a key -> entity ID map."""
+        entity_id = key_to_entity.get(key)
+        if entity_id:
+            return entity_id
 
         LOGGER.warning("Could not find entity for key: %s", key)
         return None
@@ -433,41 +429,39 @@ class MagicTodoOptionsFlowHandler(config_entries.OptionsFlow):
         options[CONF_FALLBACK_LIST] = user_input.get(CONF_FALLBACK_LIST, "")
 
         # Get all todo entities for reference
-        all_todo_entities = [
-            eid
-            for eid in self.hass.states.async_entity_ids(TODO_DOMAIN)
-            if self.hass.states.get(eid)
-            and self.hass.states.get(eid).state != "unavailable"
-        ]
+        all_todo_entities = self._valid_todo_entities
+
+        # Selections as sets so each entity's membership checks are constant time
+        auto_due_parsing_entities = set(user_input.get("auto_due_parsing_entities", ()))
+        auto_sort_entities = set(user_input.get("auto_sort_entities", ()))
+        process_recurring_entities = set(
+            user_input.get("process_recurring_entities", ())
+        )
+        auto_clear_entities = set(user_input.get("auto_clear_entities", ()))
 
         # Convert each entity selection to individual settings
         for entity_id in all_todo_entities:
             entity_key = self._entity_id_to_key(entity_id)
 
             # Auto due parsing
-            options[f"{entity_key}_auto_due_parsing"] = entity_id in user_input.get(
-                "auto_due_parsing_entities", []
+            options[f"{entity_key}_auto_due_parsing"] = (
+                entity_id in auto_due_parsing_entities
             )
 
             # Auto sort
-            options[f"{entity_key}_auto_sort"] = entity_id in user_input.get(
-                "auto_sort_entities", []
-            )
+            options[f"{entity_key}_auto_sort"] = entity_id in auto_sort_entities
 
             # Process recurring
-            options[f"{entity_key}_process_recurring"] = entity_id in user_input.get(
-                "process_recurring_entities", []
+            options[f"{entity_key}_process_recurring"] = (
+                entity_id in process_recurring_entities
             )
 
             # Auto clear - check for individual day setting
-            if entity_id in user_input.get("auto_clear_entities", []):
-                # Look for individual day setting for this entity
-                day_key = f"{entity_key}_clear_days"
-                if day_key in user_input:
-                    options[f"{entity_key}_clear_days"] = user_input[day_key]
-                else:
-                    options[f"{entity_key}_clear_days"] = 7  # Default
+            day_key = f"{entity_key}_clear_days"
+            if entity_id in auto_clear_entities:
+                # Look for individual day setting for this entity, default 7
+                options[day_key] = user_input.get(day_key, 7)
             else:
-                options[f"{entity_key}_clear_days"] = -1
+                options[day_key] = -1
 
         return options
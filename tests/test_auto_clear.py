@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Test script for auto-clearing completed tasks.
+This script tests which removal path auto-clear takes without requiring Home Assistant.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+TODO_DOMAIN = "todo"
+GET_ITEMS_CACHE: dict[str, tuple[float, asyncio.Future]] = {}
+GET_ITEMS_CACHE_TTL = 0.5
+ISO_DAY_PATTERN = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+
+# Copy relevant functions to avoid Home Assistant dependencies
+def start_of_today() -> datetime:
+    """Return today at midnight as a naive datetime."""
+    # date.today() skips the time-of-day fields that datetime.now() would build only to zero out
+    return datetime.fromordinal(date.today().toordinal())
+
+
+@lru_cache(maxsize=1024)
+def parse_due_date(due_string: str) -> datetime:
+    """Parse a todo item's due value ('YYYY-MM-DD' or an ISO datetime) as a naive datetime.
+    
+    Raises:
+        ValueError: if the value isn't a valid date or datetime
+    """
+    if "T" in due_string:
+        # Due datetime format; fromisoformat accepts a trailing 'Z' on Python 3.11+
+        # Convert to naive datetime for comparison
+        return datetime.fromisoformat(due_string).replace(tzinfo=None)
+    
+    # Due date only format; fromisoformat is implemented in C, strptime covers anything non-canonical
+    if ISO_DAY_PATTERN.fullmatch(due_string):
+        return datetime.fromisoformat(due_string)
+    return datetime.strptime(due_string, "%Y-%m-%d")
+
+
+class GetItemsFetchCancelled(Exception):
+    """Raised to callers sharing a get_items fetch whose starting task was cancelled."""
+
+
+async def get_items_cached(hass: HomeAssistant, entity_id: str, 
+                           ttl: float = GET_ITEMS_CACHE_TTL) -> dict[str, Any] | None:
+    """Fetch todo items for an entity, sharing recent or in-flight fetches.
+    
+    Callers within ttl seconds of each other await the same get_items call.
+    The returned response is shared, so callers must not mutate it.
+    
+    Args:
+        hass: Home Assistant instance
+        entity_id: Todo entity ID
+        ttl: Seconds a fetch result may be reused
+    
+    Returns:
+        The get_items service response
+    """
+    now = hass.loop.time()
+    cached = GET_ITEMS_CACHE.get(entity_id)
+    if cached and now - cached[0] < ttl:
+        try:
+            # Shield so one cancelled waiter doesn't cancel the fetch for the others
+            return await asyncio.shield(cached[1])
+        except GetItemsFetchCancelled:
+            # The task that started the fetch was cancelled, not this one; fetch again
+            return await get_items_cached(hass, entity_id, ttl)
+    
+    future = hass.loop.create_future()
+    GET_ITEMS_CACHE[entity_id] = (now, future)
+    try:
+        result = await hass.services.async_call(
+            TODO_DOMAIN,
+            "get_items",
+            {"entity_id": entity_id},
+            blocking=True,
+            return_response=True
+        )
+    except BaseException as err:
+        # Don't let later callers reuse a failed fetch
+        if GET_ITEMS_CACHE.get(entity_id, (None, None))[1] is future:
+            del GET_ITEMS_CACHE[entity_id]
+        # Waiters weren't cancelled themselves, so hand them an error they can retry on
+        # rather than cancelling the shared future
+        future.set_exception(err if isinstance(err, Exception) else GetItemsFetchCancelled())
+        # Mark retrieved so an unawaited failure isn't logged by asyncio
+        future.exception()
+        raise
+    
+    future.set_result(result)
+    return result
+
+
+def invalidate_items_cache(entity_id: str) -> None:
+    """Drop the cached get_items result for an entity after it was modified."""
+    GET_ITEMS_CACHE.pop(entity_id, None)
+
+
+def should_clear_completed_task(item: dict[str, Any], clear_days: int, today: datetime | None = None) -> bool:
+    """Determine if a completed task should be cleared based on age.
+    
+    Args:
+        item: Task item dictionary
+        clear_days: Number of days to keep completed tasks (-1 = disabled, 0+ = enabled)
+        today: Today at midnight; pass it in when checking many tasks at once
+    
+    Returns:
+        True if task should be cleared, False otherwise
+    """
+    if clear_days < 0:
+        # Auto-clear disabled
+        return False
+    
+    if item.get("status") != "completed":
+        # Only clear completed tasks
+        return False
+    
+    # Get completion date if available, otherwise use due date as fallback
+    due_date_str = item.get("due", "")
+    if not due_date_str:
+        # No date information available
+        if clear_days == 0:
+            # For immediate clearing, clear all completed tasks regardless of due date
+            return True
+        else:
+            # For time-based clearing, can't determine age without date
+            return False
+    
+    # For immediate clearing, clear all completed tasks regardless of due date
+    if clear_days == 0:
+        return True
+    
+    try:
+        # Parse the due date
+        task_date = parse_due_date(due_date_str)
+        
+        task_date_only = task_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        if today is None:
+            today = start_of_today()
+        
+        # Calculate age in days
+        age_days = (today - task_date_only).days
+        
+        # Clear if task is older than the configured number of days
+        return age_days > clear_days
+        
+    except (ValueError, TypeError) as err:
+        LOGGER.warning("Could not parse date for completed task: %s - %s", due_date_str, err)
+        return False
+
+
+async def clear_completed_tasks_if_enabled(hass: HomeAssistant, entity_id: str, settings: dict[str, Any]) -> None:
+    """Clear completed tasks for an entity if auto-clear is enabled.
+    
+    Args:
+        hass: Home Assistant instance
+        entity_id: Todo entity ID
+        settings: Entity settings dictionary
+    """
+    clear_days = settings.get("clear_days", -1)
+    if clear_days < 0:
+        # Auto-clear disabled for this entity
+        return
+    
+    try:
+        # Get all items from the todo list
+        result = await get_items_cached(hass, entity_id)
+        
+        if not result or entity_id not in result or "items" not in result[entity_id]:
+            LOGGER.debug("No items found for auto-clear: %s", entity_id)
+            return
+        
+        items = result[entity_id]["items"]
+        
+        # Find completed tasks that should be cleared
+        tasks_to_clear = []
+        today = start_of_today()
+        for item in items:
+            LOGGER.debug("Checking item for clearing: %s, status=%s, due=%s", 
+                        item.get("summary"), item.get("status"), item.get("due"))
+            should_clear = should_clear_completed_task(item, clear_days, today)
+            LOGGER.debug("Should clear result: %s", should_clear)
+            if should_clear:
+                tasks_to_clear.append(item)
+        
+        if not tasks_to_clear:
+            LOGGER.debug("No completed tasks to clear for %s (found %d completed items)", entity_id, 
+                        len([item for item in items if item.get("status") == "completed"]))
+            return
+        
+        LOGGER.debug("Found %d completed tasks to clear for %s", len(tasks_to_clear), entity_id)
+        
+        async def remove_individually() -> None:
+            """Remove just the tasks due for clearing, all dispatched at once."""
+            # Removing by uid keeps concurrent removals of tasks with the same summary
+            # from targeting the same item
+            tasks_with_summary = [item for item in tasks_to_clear if item.get("summary", "")]
+            results = await asyncio.gather(
+                *(hass.services.async_call(
+                    TODO_DOMAIN,
+                    "remove_item",
+                    {
+                        "entity_id": entity_id,
+                        "item": item.get("uid") or item["summary"]
+                    },
+                    blocking=True
+                ) for item in tasks_with_summary),
+                return_exceptions=True
+            )
+            
+            cleared_count = 0
+            for item, item_result in zip(tasks_with_summary, results):
+                summary = item["summary"]
+                if isinstance(item_result, BaseException):
+                    LOGGER.warning("Could not clear completed task '%s': %s", summary, item_result)
+                else:
+                    cleared_count += 1
+                    LOGGER.debug("Cleared completed task: %s", summary)
+            
+            if cleared_count > 0:
+                LOGGER.info("Auto-cleared %d completed tasks for %s using individual removal", 
+                           cleared_count, entity_id)
+        
+        # remove_completed_items removes ALL completed items, so it's only usable when every
+        # completed item is due for clearing; otherwise remove just the ones that are, rather
+        # than bulk clearing and re-adding the rest
+        cleared_ids = {id(item) for item in tasks_to_clear}
+        keeps_completed = any(
+            item.get("status") == "completed" and id(item) not in cleared_ids for item in items
+        )
+        
+        if keeps_completed:
+            await remove_individually()
+        else:
+            try:
+                await hass.services.async_call(
+                    TODO_DOMAIN,
+                    "remove_completed_items",
+                    {"entity_id": entity_id},
+                    blocking=True
+                )
+                LOGGER.info("Auto-cleared completed tasks for %s using bulk removal", entity_id)
+                
+            except Exception as bulk_err:
+                LOGGER.debug("Bulk removal failed for %s, trying individual removal: %s", entity_id, bulk_err)
+                await remove_individually()
+        
+        invalidate_items_cache(entity_id)
+    
+    except Exception as err:
+        LOGGER.error("Error during auto-clear for %s: %s", entity_id, err)
+
+
+class FakeServices:
+    """A todo list that answers the service calls auto-clear makes and records them."""
+
+    def __init__(self, items: list[dict[str, Any]], bulk_fails: bool = False):
+        self.items = items
+        self.bulk_fails = bulk_fails
+        self.calls: list[tuple[str, Any]] = []
+
+    async def async_call(self, domain, service, data, blocking=False, return_response=False):
+        if service == "get_items":
+            return {data["entity_id"]: {"items": [dict(item) for item in self.items]}}
+        self.calls.append((service, data.get("item")))
+        if service == "remove_completed_items":
+            if self.bulk_fails:
+                raise RuntimeError("remove_completed_items not supported")
+            self.items = [item for item in self.items if item["status"] != "completed"]
+        elif service == "remove_item":
+            matches = [item for item in self.items if data["item"] in (item["uid"], item["summary"])]
+            self.items.remove(matches[0])
+
+
+class FakeHass:
+    """Just the parts of hass that auto-clear uses."""
+
+    def __init__(self, services: FakeServices):
+        self.loop = asyncio.get_running_loop()
+        self.services = services
+
+
+def days_ago(days: int) -> str:
+    """Due date string for a day relative to today."""
+    return (start_of_today() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def run_auto_clear(items: list[dict[str, Any]], clear_days: int,
+                   bulk_fails: bool = False) -> FakeServices:
+    """Run auto-clear against a fake list and return it."""
+    GET_ITEMS_CACHE.clear()
+
+    async def run():
+        services = FakeServices(items, bulk_fails)
+        await clear_completed_tasks_if_enabled(FakeHass(services), "todo.chores",
+                                               {"clear_days": clear_days})
+        return services
+
+    return asyncio.run(run())
+
+
+def remaining_uids(services: FakeServices) -> list[str]:
+    """UIDs left on the fake list."""
+    return [item["uid"] for item in services.items]
+
+
+def test_bulk_removal_when_nothing_kept():
+    """Test remove_completed_items is used when every completed task is due for clearing."""
+    print("\n=== Testing Bulk Removal ===")
+
+    items = [
+        {"uid": "1", "summary": "Old chore", "status": "completed", "due": days_ago(10)},
+        {"uid": "2", "summary": "Open chore", "status": "needs_action", "due": days_ago(10)},
+        {"uid": "3", "summary": "Older chore", "status": "completed", "due": days_ago(20)},
+    ]
+    services = run_auto_clear(items, clear_days=3)
+    print(f"Calls: {services.calls}")
+    assert services.calls == [("remove_completed_items", None)], f"Expected one bulk call, got {services.calls}"
+    assert remaining_uids(services) == ["2"]
+
+    # clear_days 0 clears every completed task, with or without a due date
+    items = [
+        {"uid": "1", "summary": "Done", "status": "completed"},
+        {"uid": "2", "summary": "Done today", "status": "completed", "due": days_ago(0)},
+        {"uid": "3", "summary": "Open", "status": "needs_action"},
+    ]
+    services = run_auto_clear(items, clear_days=0)
+    assert services.calls == [("remove_completed_items", None)], f"Expected one bulk call, got {services.calls}"
+    assert remaining_uids(services) == ["3"]
+    print("✓ Bulk removal test passed")
+
+
+def test_kept_tasks_survive_individual_removal():
+    """Test completed tasks within clear_days are kept, removing the rest by uid."""
+    print("\n=== Testing Individual Removal ===")
+
+    items = [
+        {"uid": "1", "summary": "Water plants", "status": "completed", "due": days_ago(10)},
+        {"uid": "2", "summary": "Water plants", "status": "completed", "due": days_ago(1)},
+        {"uid": "3", "summary": "Take out trash", "status": "completed", "due": days_ago(3)},
+        {"uid": "4", "summary": "Pay rent", "status": "completed", "due": days_ago(4)},
+        {"uid": "5", "summary": "No date", "status": "completed"},
+        {"uid": "6", "summary": "Open chore", "status": "needs_action", "due": days_ago(30)},
+    ]
+    services = run_auto_clear(items, clear_days=3)
+    print(f"Calls: {services.calls}")
+    assert ("remove_completed_items", None) not in services.calls, \
+        "Bulk removal would also clear the tasks being kept"
+    assert sorted(services.calls) == [("remove_item", "1"), ("remove_item", "4")], \
+        f"Only the old tasks should be removed, by uid: {services.calls}"
+    assert remaining_uids(services) == ["2", "3", "5", "6"], \
+        f"Recent, undated and open tasks should survive, got {remaining_uids(services)}"
+    print("✓ Individual removal test passed")
+
+
+def test_bulk_failure_falls_back_to_individual():
+    """Test a failed bulk removal falls back to removing each task."""
+    print("\n=== Testing Bulk Fallback ===")
+
+    items = [
+        {"uid": "1", "summary": "Old chore", "status": "completed", "due": days_ago(10)},
+        {"uid": "2", "summary": "Older chore", "status": "completed", "due": days_ago(20)},
+    ]
+    services = run_auto_clear(items, clear_days=3, bulk_fails=True)
+    print(f"Calls: {services.calls}")
+    assert services.calls[0] == ("remove_completed_items", None)
+    assert sorted(services.calls[1:]) == [("remove_item", "1"), ("remove_item", "2")]
+    assert remaining_uids(services) == []
+    print("✓ Bulk fallback test passed")
+
+
+def test_nothing_to_clear():
+    """Test no removal is attempted when nothing is due for clearing or auto-clear is off."""
+    print("\n=== Testing Nothing To Clear ===")
+
+    items = [{"uid": "1", "summary": "Recent", "status": "completed", "due": days_ago(1)}]
+    services = run_auto_clear(items, clear_days=3)
+    assert services.calls == [], f"Expected no removals, got {services.calls}"
+
+    items = [{"uid": "1", "summary": "Old", "status": "completed", "due": days_ago(10)}]
+    services = run_auto_clear(items, clear_days=-1)
+    assert services.calls == [], f"Auto-clear disabled should not remove anything, got {services.calls}"
+    print("✓ Nothing to clear test passed")
+
+
+def run_all_tests():
+    """Run all auto-clear tests."""
+    print("Running Auto-Clear Tests")
+    print("=" * 50)
+
+    try:
+        test_bulk_removal_when_nothing_kept()
+        test_kept_tasks_survive_individual_removal()
+        test_bulk_failure_falls_back_to_individual()
+        test_nothing_to_clear()
+
+        print("\n" + "=" * 50)
+        print("✅ All auto-clear tests passed!")
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n💥 Unexpected error: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
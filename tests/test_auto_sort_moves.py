@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Test script for choosing which items auto-sort moves.
+This script checks that the planned moves reproduce the sorted order without requiring Home Assistant.
+"""
+
+import random
+from bisect import bisect_left
+
+
+# Copy relevant functions to avoid Home Assistant dependencies
+def find_uids_in_place(current_uids: list[str], sorted_uids: list[str]) -> set[str]:
+    """Find the items that don't need to move when reordering a list.
+    
+    The longest run of items whose current positions are already in sorted
+    order (a longest increasing subsequence) can stay where it is; moving
+    every other item after its sorted predecessor gives the sorted order
+    with as few moves as possible.
+    
+    Args:
+        current_uids: Item UIDs in their current order
+        sorted_uids: Item UIDs in the desired order
+    
+    Returns:
+        Set of UIDs that can stay in place
+    """
+    current_positions = {uid: index for index, uid in enumerate(current_uids)}
+    candidates = [uid for uid in sorted_uids if uid in current_positions]
+    
+    # tail_indexes[k]: index into candidates of the smallest position ending an increasing run of length k + 1
+    tail_positions: list[int] = []
+    tail_indexes: list[int] = []
+    predecessors: list[int] = []
+    for index, uid in enumerate(candidates):
+        position = current_positions[uid]
+        length = bisect_left(tail_positions, position)
+        predecessors.append(tail_indexes[length - 1] if length else -1)
+        if length == len(tail_positions):
+            tail_positions.append(position)
+            tail_indexes.append(index)
+        else:
+            tail_positions[length] = position
+            tail_indexes[length] = index
+    
+    uids_in_place = set()
+    index = tail_indexes[-1] if tail_indexes else -1
+    while index >= 0:
+        uids_in_place.add(candidates[index])
+        index = predecessors[index]
+    return uids_in_place
+
+
+def apply_moves(current_uids: list[str], sorted_uids: list[str]) -> tuple[list[str], int]:
+    """Replay the auto-sort move loop against a list, like a todo provider would.
+    
+    Items in place are skipped; every other item is moved after the previous
+    sorted item (or to the top when previous_uid is None).
+    
+    Returns:
+        The reordered UIDs and the number of moves made
+    """
+    uids_in_place = find_uids_in_place(current_uids, sorted_uids)
+    order = list(current_uids)
+    moves_made = 0
+    previous_uid = None
+    for target_uid in sorted_uids:
+        if target_uid in uids_in_place:
+            previous_uid = target_uid
+            continue
+        order.remove(target_uid)
+        order.insert(order.index(previous_uid) + 1 if previous_uid else 0, target_uid)
+        moves_made += 1
+        previous_uid = target_uid
+    return order, moves_made
+
+
+def check(current_uids: list[str], sorted_uids: list[str], expected_moves: int):
+    """Assert the moves sort the list with the expected number of moves."""
+    order, moves_made = apply_moves(current_uids, sorted_uids)
+    print(f"{current_uids} -> {order} ({moves_made} moves)")
+    assert order == sorted_uids, f"Expected {sorted_uids}, got {order}"
+    assert moves_made == expected_moves, f"Expected {expected_moves} moves, got {moves_made}"
+
+
+def test_already_sorted():
+    """Test that a sorted list needs no moves."""
+    print("\n=== Testing Already Sorted ===")
+    
+    uids = ["a", "b", "c", "d"]
+    assert find_uids_in_place(uids, uids) == set(uids), "Every item should stay in place"
+    check(uids, uids, 0)
+    print("✓ Already sorted test passed")
+
+
+def test_reversed():
+    """Test that a reversed list keeps one item and moves the rest."""
+    print("\n=== Testing Reversed ===")
+    
+    sorted_uids = ["a", "b", "c", "d", "e"]
+    check(list(reversed(sorted_uids)), sorted_uids, 4)
+    print("✓ Reversed test passed")
+
+
+def test_single_item_displaced():
+    """Test that one out-of-place item is the only one moved."""
+    print("\n=== Testing Single Item Displaced ===")
+    
+    sorted_uids = ["a", "b", "c", "d", "e"]
+    # Item moved down, item moved up, first item moved to the end
+    for current_uids in (["a", "c", "d", "b", "e"], ["a", "b", "e", "c", "d"], ["b", "c", "d", "e", "a"]):
+        check(current_uids, sorted_uids, 1)
+    # Item that belongs first is moved to the top (previous_uid None)
+    check(["b", "c", "a", "d"], ["a", "b", "c", "d"], 1)
+    print("✓ Single item displaced test passed")
+
+
+def test_duplicate_summaries():
+    """Test items with the same summary are told apart by UID."""
+    print("\n=== Testing Duplicate Summaries ===")
+    
+    items = [
+        {"uid": "1", "summary": "Water plants", "due": "2025-01-03"},
+        {"uid": "2", "summary": "Water plants", "due": "2025-01-01"},
+        {"uid": "3", "summary": "Water plants", "due": "2025-01-02"},
+        {"uid": "4", "summary": "Water plants"},
+    ]
+    sorted_items = sorted(items, key=lambda item: (not item.get("due"), item.get("due", "")))
+    current_uids = [item["uid"] for item in items]
+    sorted_uids = [item["uid"] for item in sorted_items]
+    assert sorted_uids == ["2", "3", "1", "4"]
+    check(current_uids, sorted_uids, 1)
+    print("✓ Duplicate summaries test passed")
+
+
+def test_empty_list():
+    """Test that an empty list needs no moves."""
+    print("\n=== Testing Empty List ===")
+    
+    assert find_uids_in_place([], []) == set(), "Nothing can stay in place in an empty list"
+    check([], [], 0)
+    print("✓ Empty list test passed")
+
+
+def test_random_orders():
+    """Test random orders sort with the fewest moves (items not in the longest sorted run)."""
+    print("\n=== Testing Random Orders ===")
+    
+    rng = random.Random(1234)
+    for _ in range(500):
+        sorted_uids = [f"uid{index}" for index in range(rng.randint(1, 12))]
+        current_uids = rng.sample(sorted_uids, len(sorted_uids))
+        order, moves_made = apply_moves(current_uids, sorted_uids)
+        assert order == sorted_uids, f"{current_uids}: got {order}"
+        
+        # Brute-force longest run of items already in sorted order
+        positions = [current_uids.index(uid) for uid in sorted_uids]
+        longest = [1] * len(positions)
+        for i in range(len(positions)):
+            for j in range(i):
+                if positions[j] < positions[i]:
+                    longest[i] = max(longest[i], longest[j] + 1)
+        assert moves_made == len(sorted_uids) - max(longest), \
+            f"{current_uids}: {moves_made} moves, expected {len(sorted_uids) - max(longest)}"
+    print("✓ Random orders test passed")
+
+
+def run_all_tests():
+    """Run all auto-sort move tests."""
+    print("Running Auto-Sort Move Tests")
+    print("=" * 50)
+    
+    try:
+        test_already_sorted()
+        test_reversed()
+        test_single_item_displaced()
+        test_duplicate_summaries()
+        test_empty_list()
+        test_random_orders()
+        
+        print("\n" + "=" * 50)
+        print("✅ All auto-sort move tests passed!")
+        
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n💥 Unexpected error: {e}")
+        return False
+    
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test script for the BoundedSet used to remember processed items.
+This script tests expiry and eviction with a fake clock without requiring Home Assistant.
+"""
+
+import time
+from collections import OrderedDict
+from unittest.mock import patch
+
+
+# Copy relevant classes to avoid Home Assistant dependencies
+class BoundedSet:
+    """Set of keys that expire after ttl_seconds and hold at most maxlen entries."""
+
+    def __init__(self, maxlen: int, ttl_seconds: float) -> None:
+        """Initialize an empty set."""
+        self.maxlen = maxlen
+        self.ttl_seconds = ttl_seconds
+        # Key -> time added, oldest first
+        self._entries: OrderedDict[str, float] = OrderedDict()
+
+    def add(self, key: str) -> None:
+        """Add a key, evicting the oldest entry when full."""
+        self._entries.pop(key, None)
+        self._entries[key] = time.monotonic()
+        if len(self._entries) > self.maxlen:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        """Remove a key if present."""
+        self._entries.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the key was added less than ttl_seconds ago."""
+        added = self._entries.get(key)
+        if added is None:
+            return False
+        if time.monotonic() - added >= self.ttl_seconds:
+            del self._entries[key]
+            return False
+        return True
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_expiry_after_ttl():
+    """Test keys are kept until ttl_seconds have passed."""
+    print("\n=== Testing Expiry ===")
+    clock = FakeClock()
+    with patch("time.monotonic", clock):
+        seen = BoundedSet(maxlen=10, ttl_seconds=60)
+        seen.add("a")
+        clock.now += 59.9
+        assert "a" in seen, "Key should still be present just before the TTL"
+        clock.now += 0.1
+        assert "a" not in seen, "Key should expire once the TTL has passed"
+    print("✓ Expiry test passed")
+
+
+def test_eviction_order_at_capacity():
+    """Test the oldest keys are evicted first when the set is full."""
+    print("\n=== Testing Eviction Order ===")
+    clock = FakeClock()
+    with patch("time.monotonic", clock):
+        seen = BoundedSet(maxlen=3, ttl_seconds=60)
+        for key in ("a", "b", "c"):
+            seen.add(key)
+            clock.now += 1
+        seen.add("d")
+        assert len(seen) == 3, f"Expected 3 entries, got {len(seen)}"
+        assert "a" not in seen, "Oldest key should be evicted"
+        assert all(key in seen for key in ("b", "c", "d")), "Newer keys should be kept"
+        seen.add("e")
+        assert "b" not in seen and all(key in seen for key in ("c", "d", "e"))
+    print("✓ Eviction order test passed")
+
+
+def test_re_add_refreshes_position_and_time():
+    """Test adding an existing key makes it the newest again."""
+    print("\n=== Testing Re-add ===")
+    clock = FakeClock()
+    with patch("time.monotonic", clock):
+        seen = BoundedSet(maxlen=3, ttl_seconds=60)
+        for key in ("a", "b", "c"):
+            seen.add(key)
+        seen.add("a")
+        assert len(seen) == 3, "Re-adding a key should not add a second entry"
+        seen.add("d")
+        assert "a" in seen, "Re-added key should no longer be the oldest"
+        assert "b" not in seen, "Oldest key after the re-add should be evicted"
+
+        # Re-adding also restarts the TTL
+        clock.now += 50
+        seen.add("c")
+        clock.now += 20
+        assert "c" in seen, "Re-added key should expire from its new time"
+        assert "d" not in seen, "Key not re-added should expire from its old time"
+    print("✓ Re-add test passed")
+
+
+def test_contains_drops_expired_keys():
+    """Test checking an expired key removes it and discard forgets keys."""
+    print("\n=== Testing Expired Lookups ===")
+    clock = FakeClock()
+    with patch("time.monotonic", clock):
+        seen = BoundedSet(maxlen=10, ttl_seconds=60)
+        seen.add("a")
+        seen.add("b")
+        clock.now += 60
+        assert len(seen) == 2, "Expired keys stay stored until looked up"
+        assert "a" not in seen
+        assert len(seen) == 1, "Looking up an expired key should evict it"
+        assert "missing" not in seen
+        seen.add("c")
+        seen.discard("c")
+        seen.discard("missing")
+        assert "c" not in seen, "Discarded key should be gone"
+    print("✓ Expired lookups test passed")
+
+
+def run_all_tests():
+    """Run all BoundedSet tests."""
+    print("Running BoundedSet Tests")
+    print("=" * 50)
+
+    try:
+        test_expiry_after_ttl()
+        test_eviction_order_at_capacity()
+        test_re_add_refreshes_position_and_time()
+        test_contains_drops_expired_keys()
+
+        print("\n" + "=" * 50)
+        print("✅ All BoundedSet tests passed!")
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n💥 Unexpected error: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared get_items fetch cache.
+This script tests fetch sharing and cancellation handling without requiring Home Assistant.
+"""
+
+import asyncio
+from typing import Any
+
+TODO_DOMAIN = "todo"
+GET_ITEMS_CACHE: dict[str, tuple[float, asyncio.Future]] = {}
+GET_ITEMS_CACHE_TTL = 0.5
+
+
+# Copy relevant functions to avoid Home Assistant dependencies
+class GetItemsFetchCancelled(Exception):
+    """Raised to callers sharing a get_items fetch whose starting task was cancelled."""
+
+
+async def get_items_cached(hass, entity_id: str,
+                           ttl: float = GET_ITEMS_CACHE_TTL) -> dict[str, Any] | None:
+    """Fetch todo items for an entity, sharing recent or in-flight fetches."""
+    now = hass.loop.time()
+    cached = GET_ITEMS_CACHE.get(entity_id)
+    if cached and now - cached[0] < ttl:
+        try:
+            # Shield so one cancelled waiter doesn't cancel the fetch for the others
+            return await asyncio.shield(cached[1])
+        except GetItemsFetchCancelled:
+            # The task that started the fetch was cancelled, not this one; fetch again
+            return await get_items_cached(hass, entity_id, ttl)
+
+    future = hass.loop.create_future()
+    GET_ITEMS_CACHE[entity_id] = (now, future)
+    try:
+        result = await hass.services.async_call(
+            TODO_DOMAIN,
+            "get_items",
+            {"entity_id": entity_id},
+            blocking=True,
+            return_response=True
+        )
+    except BaseException as err:
+        # Don't let later callers reuse a failed fetch
+        if GET_ITEMS_CACHE.get(entity_id, (None, None))[1] is future:
+            del GET_ITEMS_CACHE[entity_id]
+        # Waiters weren't cancelled themselves, so hand them an error they can retry on
+        # rather than cancelling the shared future
+        future.set_exception(err if isinstance(err, Exception) else GetItemsFetchCancelled())
+        # Mark retrieved so an unawaited failure isn't logged by asyncio
+        future.exception()
+        raise
+
+    future.set_result(result)
+    return result
+
+
+class FakeServices:
+    """Records get_items calls and answers them after a short delay."""
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+
+    async def async_call(self, domain, service, data, blocking=False, return_response=False):
+        self.calls += 1
+        call_number = self.calls
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("service unavailable")
+        return {data["entity_id"]: {"items": [{"summary": f"fetch {call_number}"}]}}
+
+
+class FakeHass:
+    """Just the parts of hass that get_items_cached uses."""
+
+    def __init__(self, services: FakeServices):
+        self.loop = asyncio.get_running_loop()
+        self.services = services
+
+
+def test_concurrent_callers_share_fetch():
+    """Test that callers arriving while a fetch is in flight share it."""
+    print("\n=== Testing Shared Fetch ===")
+    GET_ITEMS_CACHE.clear()
+
+    async def run():
+        services = FakeServices()
+        hass = FakeHass(services)
+        first, second = await asyncio.gather(
+            get_items_cached(hass, "todo.a"),
+            get_items_cached(hass, "todo.a"),
+        )
+        return services.calls, first, second
+
+    calls, first, second = asyncio.run(run())
+
+    assert calls == 1, f"Expected 1 get_items call, got {calls}"
+    assert first is second, "Both callers should get the same response"
+    print("✓ Shared fetch test passed")
+
+
+def test_owner_cancelled_waiter_fetches_again():
+    """Test that cancelling the task that started a fetch doesn't cancel the other callers."""
+    print("\n=== Testing Cancelled Fetch Owner ===")
+    GET_ITEMS_CACHE.clear()
+
+    async def run():
+        services = FakeServices()
+        hass = FakeHass(services)
+        owner = asyncio.ensure_future(get_items_cached(hass, "todo.a"))
+        await asyncio.sleep(0)  # let the owner start the fetch
+        waiter = asyncio.ensure_future(get_items_cached(hass, "todo.a"))
+        await asyncio.sleep(0)  # let the waiter join the shared fetch
+        owner.cancel()
+
+        owner_result = await asyncio.gather(owner, return_exceptions=True)
+        waiter_result = await waiter
+        return services.calls, owner_result[0], waiter_result
+
+    calls, owner_result, waiter_result = asyncio.run(run())
+
+    print(f"Owner result:  {owner_result!r}")
+    print(f"Waiter result: {waiter_result!r}")
+
+    assert isinstance(owner_result, asyncio.CancelledError), "The owner itself should be cancelled"
+    assert waiter_result == {"todo.a": {"items": [{"summary": "fetch 2"}]}}, \
+        "The waiter should get the result of its own fetch"
+    assert calls == 2, f"Expected the waiter to fetch again, got {calls} calls"
+    print("✓ Cancelled fetch owner test passed")
+
+
+def test_failed_fetch_not_reused():
+    """Test that a failed fetch reaches every caller and isn't cached."""
+    print("\n=== Testing Failed Fetch ===")
+    GET_ITEMS_CACHE.clear()
+
+    async def run():
+        services = FakeServices(fail=True)
+        hass = FakeHass(services)
+        results = await asyncio.gather(
+            get_items_cached(hass, "todo.a"),
+            get_items_cached(hass, "todo.a"),
+            return_exceptions=True,
+        )
+        return services.calls, results
+
+    calls, results = asyncio.run(run())
+
+    assert calls == 1, f"Expected 1 get_items call, got {calls}"
+    assert all(isinstance(result, RuntimeError) for result in results), \
+        f"Both callers should see the service error, got {results}"
+    assert "todo.a" not in GET_ITEMS_CACHE, "A failed fetch should not stay cached"
+    print("✓ Failed fetch test passed")
+
+
+def run_all_tests():
+    """Run all get_items cache tests."""
+    print("Running get_items Cache Tests")
+    print("=" * 50)
+
+    try:
+        test_concurrent_callers_share_fetch()
+        test_owner_cancelled_waiter_fetches_again()
+        test_failed_fetch_not_reused()
+
+        print("\n" + "=" * 50)
+        print("✅ All get_items cache tests passed!")
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n💥 Unexpected error: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Test script for the precompiled date and time format matching.
+This script checks the regex matching agrees with datetime.strptime without requiring Home Assistant.
+"""
+
+import itertools
+import re
+from datetime import datetime
+
+
+# Copy relevant constants and functions to avoid Home Assistant dependencies
+# Supported numeric date and time formats, tried in order
+DATE_FORMATS = ['%m/%d/%y', '%m/%d/%Y', '%m-%d-%y', '%m-%d-%Y', '%Y-%m-%d', '%Y/%m/%d', '%Y.%m.%d', '%d-%m-%Y', '%d/%m/%Y', '%d.%m.%Y', '%m.%d.%Y', '%Y-%d-%m', '%Y/%d/%m', '%Y.%d.%m', '%d-%Y-%m', '%d/%Y/%m', '%d.%Y.%m', '%m-%Y-%d', '%m/%Y/%d', '%m.%Y.%d']
+TIME_FORMATS = ['%H:%M', '%H %M', '%H%M']
+
+# Field regexes copied from CPython's _strptime so matching behaves exactly like datetime.strptime
+STRPTIME_FIELD_PATTERNS = {
+    'd': r'(3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+    'm': r'(1[0-2]|0[1-9]|[1-9])',
+    'y': r'(\d\d)',
+    'Y': r'(\d\d\d\d)',
+    'H': r'(2[0-3]|[0-1]\d|\d)',
+    'M': r'([0-5]\d|\d)',
+}
+
+
+def compile_strptime_format(given_format: str) -> tuple[re.Pattern, str]:
+    """Compile a numeric strptime format into a regex and its field order.
+    
+    Like strptime, literal whitespace in the format matches any run of whitespace.
+    
+    Returns:
+        (compiled pattern, directive letters in the order they are captured)
+    """
+    parts = []
+    fields = ""
+    for piece in re.split(r'(%[a-zA-Z])', given_format):
+        if piece.startswith('%'):
+            parts.append(STRPTIME_FIELD_PATTERNS[piece[1]])
+            fields += piece[1]
+        elif piece:
+            parts.append(r'\s+'.join(re.escape(literal) for literal in re.split(r'\s+', piece)))
+    return re.compile(''.join(parts)), fields
+
+
+# Compiled once; only strings shaped like three numeric fields with a repeated separator can match a date format
+COMPILED_DATE_FORMATS = [compile_strptime_format(date_format) for date_format in DATE_FORMATS]
+COMPILED_TIME_FORMATS = [compile_strptime_format(time_format) for time_format in TIME_FORMATS]
+DATE_SHAPE_PATTERN = re.compile(r' ?\d+([-/.]) ?\d+\1 ?\d+')
+
+
+def match_compiled_formats(given_string: str, compiled_formats: list[tuple[re.Pattern, str]]) -> datetime | None:
+    """Return the datetime for the first format that parses given_string, like strptime would."""
+    for pattern, fields in compiled_formats:
+        match = pattern.match(given_string)
+        # strptime rejects input with unconverted data left over
+        if not match or match.end() != len(given_string):
+            continue
+        values = dict(zip(fields, match.groups()))
+        if 'Y' in values:
+            year = int(values['Y'])
+        elif 'y' in values:
+            year = int(values['y'])
+            # strptime's two-digit year pivot: 69-99 -> 1900s, 00-68 -> 2000s
+            year += 2000 if year <= 68 else 1900
+        else:
+            year = 1900
+        try:
+            return datetime(year, int(values.get('m', 1)), int(values.get('d', 1)),
+                            int(values.get('H', 0)), int(values.get('M', 0)))
+        except ValueError:
+            # Out of range for the month (e.g. Feb 30); strptime fails too, try the next format
+            continue
+    return None
+
+
+def strptime_formats(given_string: str, formats: list[str]) -> datetime | None:
+    """Reference: the first format strptime accepts, as the code did before precompiling."""
+    for given_format in formats:
+        try:
+            return datetime.strptime(given_string, given_format)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_numeric_date(given_string: str) -> datetime | None:
+    """Same prefilters as parse_numeric_date in the integration."""
+    if any(char.isalpha() for char in given_string):
+        return None
+    if not DATE_SHAPE_PATTERN.fullmatch(given_string):
+        return None
+    return match_compiled_formats(given_string, COMPILED_DATE_FORMATS)
+
+
+# Field values to fill each directive with: padded, unpadded, space-padded and out of range
+FIELD_SAMPLES = {
+    'd': ['01', '1', ' 1', '09', '28', '29', '30', '31', '32', '00', '003'],
+    'm': ['01', '1', '02', '2', '09', '12', '13', '0', ' 2'],
+    'y': ['00', '24', '68', '69', '99', '5', '123'],
+    'Y': ['2024', '2025', '1999', '0001', '24', '20245'],
+    'H': ['0', '00', '07', '7', '23', '24', '9'],
+    'M': ['0', '00', '05', '5', '59', '60'],
+}
+
+
+def format_samples(given_format: str) -> list[str]:
+    """Build every combination of sample field values for a format."""
+    pieces = re.split(r'(%[a-zA-Z])', given_format)
+    choices = [FIELD_SAMPLES[piece[1]] if piece.startswith('%') else [piece] for piece in pieces]
+    return [''.join(combination) for combination in itertools.product(*choices)]
+
+
+def check(given_string: str, actual: datetime | None, expected: datetime | None):
+    """Assert one parse agrees with strptime."""
+    assert actual == expected, f"{given_string!r}: expected {expected}, got {actual}"
+
+
+def test_each_format_matches_strptime():
+    """Test every date and time format on its own against strptime."""
+    print("\n=== Testing Each Format ===")
+    
+    checked = 0
+    for given_format in DATE_FORMATS + TIME_FORMATS:
+        compiled_format = [compile_strptime_format(given_format)]
+        for given_string in format_samples(given_format):
+            expected = strptime_formats(given_string, [given_format])
+            check(given_string, match_compiled_formats(given_string, compiled_format), expected)
+            checked += 1
+    print(f"Checked {checked} strings")
+    print("✓ Each format test passed")
+
+
+def test_format_lists_match_strptime():
+    """Test the full format lists pick the same format strptime would."""
+    print("\n=== Testing Format Lists ===")
+    
+    date_strings = {sample for date_format in DATE_FORMATS for sample in format_samples(date_format)}
+    for given_string in sorted(date_strings):
+        check(given_string, parse_numeric_date(given_string), strptime_formats(given_string, DATE_FORMATS))
+    
+    time_strings = {sample for time_format in TIME_FORMATS for sample in format_samples(time_format)}
+    for given_string in sorted(time_strings):
+        check(given_string, match_compiled_formats(given_string, COMPILED_TIME_FORMATS),
+              strptime_formats(given_string, TIME_FORMATS))
+    print(f"Checked {len(date_strings)} dates and {len(time_strings)} times")
+    print("✓ Format lists test passed")
+
+
+def test_edge_cases():
+    """Test invalid days, two-digit years and unpadded fields explicitly."""
+    print("\n=== Testing Edge Cases ===")
+    
+    cases = {
+        # Invalid days: no format accepts them
+        '02/30/2025': None,
+        '2025-02-30': None,
+        '2/29/2025': None,
+        # Leap day
+        '2/29/2024': datetime(2024, 2, 29),
+        # Two-digit years pivot at 69
+        '1/2/68': datetime(2068, 1, 2),
+        '1/2/69': datetime(1969, 1, 2),
+        '12-31-00': datetime(2000, 12, 31),
+        # Unpadded and space-padded fields
+        '1/2/2025': datetime(2025, 1, 2),
+        '2025-1-2': datetime(2025, 1, 2),
+        '2025-13-1': datetime(2025, 1, 13),  # %Y-%d-%m
+        '31.1.2025': datetime(2025, 1, 31),
+        '1/ 2/2025': datetime(2025, 1, 2),
+        # Leftover characters
+        '1/2/2025 ': None,
+        '1/2/20255': None,
+        # Mixed separators
+        '1/2-2025': None,
+    }
+    for given_string, expected in cases.items():
+        actual = parse_numeric_date(given_string)
+        print(f"{given_string!r} -> {actual}")
+        check(given_string, actual, expected)
+        check(given_string, actual, strptime_formats(given_string, DATE_FORMATS))
+    
+    for given_string in ('9:05', '09 5', '0905', '905', '23:59', '24:00', '12:60', '7  30'):
+        check(given_string, match_compiled_formats(given_string, COMPILED_TIME_FORMATS),
+              strptime_formats(given_string, TIME_FORMATS))
+    print("✓ Edge cases test passed")
+
+
+def run_all_tests():
+    """Run all date and time format tests."""
+    print("Running Date/Time Format Tests")
+    print("=" * 50)
+    
+    try:
+        test_each_format_matches_strptime()
+        test_format_lists_match_strptime()
+        test_edge_cases()
+        
+        print("\n" + "=" * 50)
+        print("✅ All date/time format tests passed!")
+        
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n💥 Unexpected error: {e}")
+        return False
+    
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)